@@ -0,0 +1,206 @@
+"""Allocation regression checks for rendering boxes.
+
+Renders representative boxes with every render engine under
+tracemalloc, and records the peak memory allocated while rendering a
+box and the amount of memory blocks a render leaves allocated. That
+is the rendered box itself. The blocks rich and the re module leave
+behind in caches of their own vary from one render to the next, so
+they are left out of the count. Consoles are created with a fixed
+width and colour system, so the measurements don't depend on the
+terminal the checks are run from.
+
+Check the measurements against the committed budgets, exiting with
+status 1 if a case allocates more than its budget allows::
+
+    python benchmarks/allocations.py check
+
+Record new budgets after an intended change::
+
+    python benchmarks/allocations.py update
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import tracemalloc
+from typing import Callable, Dict, Iterator, Tuple
+
+import rich
+from rich.console import Console
+
+import boxcli
+
+BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "allocations.json")
+
+REPEAT = 5
+
+# Leave out the snapshots themselves, and the caches of rich and re.
+IGNORE = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, os.path.join(os.path.dirname(rich.__file__), "*")),
+    tracemalloc.Filter(False, os.path.join(os.path.dirname(re.__file__), "*")),
+]
+
+CONTENTS = {
+    "small": ("Status", "All systems go"),
+    "ascii-100": (
+        "Report",
+        "\n".join(f"line {i}: " + "x" * (i % 60) for i in range(100)),
+    ),
+    "cjk-1000": (
+        "報告",
+        "\n".join("日本語のテキスト" * (1 + i % 4) for i in range(1000)),
+    ),
+    "ascii-10000": ("Log", "\n".join(f"{i:>6} request served" for i in range(10_000))),
+}
+
+
+def cases() -> Iterator[Tuple[str, Callable[[], str]]]:
+    """Yields the name and the measured render of every case."""
+    for engine in boxcli.RenderEngine:
+        console = Console(width=200, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            2,
+            1,
+            boxcli.BoxStyles.ROUND,
+            colour=boxcli.RGB((255, 128, 0)),
+            engine=engine,
+            console=console,
+        )
+
+        for name, (title, content) in CONTENTS.items():
+            yield f"{engine.name.lower()}/{name}", _case(factory, title, content)
+
+
+def _case(factory: boxcli.BoxFactory, title: str, content: str) -> Callable[[], str]:
+    return lambda: factory.get_box(title, content)
+
+
+def measure(render: Callable[[], str]) -> Dict[str, int]:
+    """Returns the peak memory and the blocks left allocated by a render.
+
+    The render runs once before it is measured, so the template and the
+    caches it fills up are not counted, and the lowest of several
+    measurements is kept. Garbage is collected around every render, so
+    reference cycles it leaves behind are not counted either."""
+    render()
+
+    peaks, blocks = [], []
+
+    for _ in range(REPEAT):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+
+        box = render()
+
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        before = before.filter_traces(IGNORE)
+        after = after.filter_traces(IGNORE)
+
+        peaks.append(peak - start)
+        blocks.append(sum(s.count_diff for s in after.compare_to(before, "filename")))
+        del box
+
+    return {"peak": min(peaks), "blocks": min(blocks)}
+
+
+def run(case_filter: str) -> Dict[str, Dict[str, int]]:
+    results = {}
+
+    for name, render in cases():
+        if case_filter and case_filter not in name:
+            continue
+
+        results[name] = measure(render)
+        print(
+            f"{name:<24} peak {results[name]['peak'] / 1024:10.1f} KiB "
+            f"blocks {results[name]['blocks']:6}",
+            flush=True,
+        )
+
+    return results
+
+
+def check(args: argparse.Namespace) -> None:
+    with open(args.budgets) as f:
+        budgets = json.load(f)["budgets"]
+
+    failures = 0
+
+    for name, result in run(args.filter).items():
+        budget = budgets.get(name)
+        if budget is None:
+            print(f"{name:<24} has no budget")
+            failures += 1
+            continue
+
+        for metric in ("peak", "blocks"):
+            allowed = budget[metric] * (1 + args.tolerance) + args.slack[metric]
+            if result[metric] > allowed:
+                print(
+                    f"{name:<24} {metric} {result[metric]} is over "
+                    f"its budget of {budget[metric]}"
+                )
+                failures += 1
+
+    if failures:
+        print(f"{failures} allocation budget(s) exceeded")
+        sys.exit(1)
+
+
+def update(args: argparse.Namespace) -> None:
+    budgets = {}
+
+    # Keep the budgets of the cases that were filtered out.
+    if args.filter and os.path.exists(args.budgets):
+        with open(args.budgets) as f:
+            budgets = json.load(f)["budgets"]
+
+    budgets.update(run(args.filter))
+
+    output = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+        },
+        "budgets": budgets,
+    }
+
+    with open(args.budgets, "w") as f:
+        json.dump(output, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budgets", default=BUDGETS)
+    parser.add_argument("--filter", help="only run cases containing this")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = commands.add_parser("check", help="check against the budgets")
+    check_parser.add_argument("--tolerance", type=float, default=0.1)
+    check_parser.set_defaults(func=check)
+
+    update_parser = commands.add_parser("update", help="record new budgets")
+    update_parser.set_defaults(func=update)
+
+    args = parser.parse_args()
+
+    # A few blocks and bytes of slack absorb interpreter noise
+    # in the cases that allocate very little.
+    args.slack = {"peak": 1024, "blocks": 2}
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark measuring heavily coloured log lines.
+
+Measures a log of coloured lines, with several SGR sequences and a
+hyperlink on every line, with the precompiled scanner of line_width,
+and with a strip and measure approach that removes the escape
+sequences and the markup with separate regular expressions before
+measuring the line with wcwidth. Then boxes a part of the log with
+every render engine, and the same part of a plain log of the same
+text for comparison.
+
+Run with ``python benchmarks/bench_ansi.py``.
+"""
+
+import random
+import re
+import time
+
+from rich.console import Console
+from wcwidth import wcswidth
+
+import boxcli
+from boxcli.width import line_width
+
+LINES = 50_000
+
+# Rich takes a long time for the whole log, box a part of it.
+BOX_LINES = 10_000
+
+LEVELS = ["\x1b[32mINFO\x1b[0m ", "\x1b[33mWARN\x1b[0m ", "\x1b[1;31mERROR\x1b[0m"]
+
+SGR = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+OSC = re.compile(r"\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+TAGS = re.compile(r"\[[a-z#/].*?\]")
+
+
+def strip_and_measure(line: str) -> int:
+    """Measures a line the way a strip and measure approach does."""
+    return wcswidth(TAGS.sub("", OSC.sub("", SGR.sub("", line))))
+
+
+def coloured_log() -> list:
+    rng = random.Random(0)
+    lines = []
+
+    for i in range(LINES):
+        level = rng.choice(LEVELS)
+        path = f"/api/items/{rng.randrange(1000)}"
+        link = f"\x1b]8;;https://example.com{path}\x1b\\{path}\x1b]8;;\x1b\\"
+        took = f"\x1b[38;2;{rng.randrange(256)};128;255m{rng.random():.3f}s\x1b[0m"
+        name = rng.choice(["\x1b[36mworker\x1b[0m", "\x1b[35m作業者\x1b[0m"])
+        lines.append(f"{i:>6} {level} {name} GET {link} took {took}")
+
+    return lines
+
+
+def main() -> None:
+    lines = coloured_log()
+    plain = [SGR.sub("", OSC.sub("", line)) for line in lines]
+
+    for name, measure in (
+        ("scanner", line_width),
+        ("scanner with markup", lambda line: line_width(line, True)),
+        ("strip and measure", strip_and_measure),
+    ):
+        start = time.perf_counter()
+        for line in lines:
+            measure(line)
+        seconds = (time.perf_counter() - start) / LINES
+        print(f"{name:<24} {seconds * 1e6:8.3f} us per line")
+
+    for engine in boxcli.RenderEngine:
+        console = Console(width=200, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1, 0, boxcli.BoxStyles.ROUND, engine=engine, console=console, max_width=0
+        )
+
+        for name, log in (("coloured", lines), ("plain", plain)):
+            content = "\n".join(log[:BOX_LINES])
+
+            start = time.perf_counter()
+            factory.get_box("Access log", content)
+            seconds = time.perf_counter() - start
+            print(f"{engine.name:<6} get_box {name:<10} {seconds * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark writing a large box to an asyncio stream.
+
+Writes a 100k line box to a local TCP connection with
+BoxFactory.write_box_async while a ticker task measures how long the
+event loop goes without running it, and compares that with writing
+the output of get_box in one go.
+
+Run with ``python benchmarks/bench_async.py``.
+"""
+
+import asyncio
+import time
+
+from rich.console import Console
+
+import boxcli
+
+LINES = {boxcli.RenderEngine.RICH: 10_000, boxcli.RenderEngine.ANSI: 100_000}
+
+
+async def discard(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while await reader.read(1 << 16):
+        pass
+    writer.close()
+
+
+async def measure(port: int, write) -> float:
+    """Returns the longest event loop stall while writing, in seconds."""
+    ticks = []
+
+    async def ticker() -> None:
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.001)
+
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+
+    await write(writer)
+    ticks.append(time.perf_counter())
+
+    task.cancel()
+    writer.close()
+    await writer.wait_closed()
+
+    return max(b - a for a, b in zip(ticks, ticks[1:]))
+
+
+async def main() -> None:
+    server = await asyncio.start_server(discard, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    for engine, lines in LINES.items():
+        console = Console(width=200, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            2, 1, boxcli.BoxStyles.ROUND, engine=engine, console=console
+        )
+        content = "\n".join(f"log line {i} " * (i % 4 + 1) for i in range(lines))
+
+        async def write_whole(writer: asyncio.StreamWriter) -> None:
+            writer.write(factory.get_box("Log", content).encode())
+            await writer.drain()
+
+        async def write_chunked(writer: asyncio.StreamWriter) -> None:
+            await factory.write_box_async(writer, "Log", content)
+
+        for name, write in (
+            ("get_box", write_whole),
+            ("write_box_async", write_chunked),
+        ):
+            start = time.perf_counter()
+            stall = await measure(port, write)
+            seconds = time.perf_counter() - start
+            print(
+                f"{engine.name:<5} {lines:>7} lines {name:<16} "
+                f"{seconds:8.3f} s  longest stall {stall * 1e3:8.1f} ms"
+            )
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+"""Benchmark rendering a large report of boxes in one batch.
+
+Compares calling get_box for every job against get_boxes and
+iter_boxes, for both render engines.
+
+Run with ``python benchmarks/bench_batch.py``.
+"""
+
+import time
+
+import boxcli
+
+JOBS = [(f"Job {i}", f"state: done\nduration: {i % 60}s") for i in range(5000)]
+
+
+def main() -> None:
+    for engine in boxcli.RenderEngine:
+        factory = boxcli.BoxFactory(
+            2, 0, boxcli.BoxStyles.SINGLE, colour=boxcli.ColourEnum.CYAN, engine=engine
+        )
+
+        runs = {
+            "get_box loop": lambda: [factory.get_box(t, c) for t, c in JOBS],
+            "get_boxes": lambda: factory.get_boxes(JOBS),
+            "iter_boxes": lambda: list(factory.iter_boxes(JOBS)),
+        }
+
+        for name, run in runs.items():
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+            per_box = seconds / len(JOBS) * 1e6
+            print(f"{engine.name:<6} {name:<14} {seconds:8.3f} s {per_box:8.2f} us/box")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark building a box up line by line.
+
+Appends the lines of a growing log to a box one at a time, and renders
+the box after every append, once with get_box for all the lines so far
+and with a builder, for every render engine. Appending to a builder
+without rendering is timed separately, for lines that are never wider
+than the widest line so far and for lines that always are.
+
+Run with ``python benchmarks/bench_builder.py``.
+"""
+
+import time
+
+from rich.console import Console
+
+import boxcli
+
+LINES = 2_000
+
+
+def main() -> None:
+    lines = [f"{i:>6} GET /api/items/{i % 977} 200" for i in range(LINES)]
+    growing = ["x" * i for i in range(LINES)]
+
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1, 0, boxcli.BoxStyles.ROUND, engine=engine, console=console
+        )
+
+        # Rich takes a long time to render every step, render fewer.
+        count = LINES // 10 if engine is boxcli.RenderEngine.RICH else LINES
+
+        start = time.perf_counter()
+        for i in range(1, count + 1):
+            factory.get_box("Access log", "\n".join(lines[:i]))
+        seconds = time.perf_counter() - start
+        print(f"{engine.name:<6} get_box per line      {seconds * 1e3:12.2f} ms")
+
+        start = time.perf_counter()
+        builder = factory.get_builder("Access log")
+        for line in lines[:count]:
+            builder.append(line)
+            builder.render()
+        seconds = time.perf_counter() - start
+        print(f"{engine.name:<6} builder per line      {seconds * 1e3:12.2f} ms")
+
+    factory = boxcli.BoxFactory(1, 0, boxcli.BoxStyles.ROUND)
+
+    for name, appended in (("same width", lines), ("growing width", growing)):
+        start = time.perf_counter()
+        builder = factory.get_builder("Access log")
+        for line in appended:
+            builder.append(line)
+        seconds = (time.perf_counter() - start) / LINES
+        print(f"append {name:<15} {seconds * 1e6:12.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark the render cache on boxes that repeat.
+
+Renders a stream of boxes drawn from a small set of banners and
+panels with get_box, with and without the render cache, for both
+render engines, and prints the counters of the cache.
+
+Run with ``python benchmarks/bench_cache.py``.
+"""
+
+import random
+import time
+
+from rich.console import Console
+
+import boxcli
+
+PANELS = [("Results", "No results found.")] + [
+    (f"Banner {i}", f"Welcome back!\nYou have {i} new messages.") for i in range(50)
+]
+
+rng = random.Random(0)
+PAIRS = [rng.choice(PANELS) for _ in range(20_000)]
+
+
+def main() -> None:
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            2, 1, boxcli.BoxStyles.DOUBLE, engine=engine, console=console
+        )
+
+        for name in ("uncached", "cached"):
+            if name == "cached":
+                cache = factory.enable_cache(max_entries=256)
+
+            start = time.perf_counter()
+            for title, content in PAIRS:
+                factory.get_box(title, content)
+            us = (time.perf_counter() - start) / len(PAIRS) * 1e6
+            print(f"{engine.name:<6} {name:<9} {us:10.3f} us/box")
+
+        print(f"{engine.name:<6} {cache.as_dict()}")
+
+
+if __name__ == "__main__":
+    main()
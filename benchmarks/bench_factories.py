@@ -0,0 +1,68 @@
+"""Benchmark creating and using hundreds of factories.
+
+Creates 500 factories, one per component, and renders a box with
+every one of them, with every factory creating a console of its own
+and with the factories sharing a console. Construction, the first
+render, which looks up the console and compiles the template, and
+later renders are timed separately, for both render engines.
+
+Run with ``python benchmarks/bench_factories.py``.
+"""
+
+import io
+import time
+import tracemalloc
+
+from rich.console import Console
+
+import boxcli
+
+FACTORIES = 500
+COLOURS = [boxcli.ColourEnum.RED, boxcli.RGB((255, 128, 0)), boxcli.ColourEnum.CYAN]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    out = io.StringIO()
+
+    for engine in boxcli.RenderEngine:
+        for name in ("shared console", "own console"):
+
+            def make(i: int) -> boxcli.BoxFactory:
+                kwargs = {"colour": COLOURS[i % len(COLOURS)], "engine": engine}
+                if name == "own console":
+                    kwargs["console"] = Console(file=out)
+                else:
+                    kwargs["file"] = out
+                return boxcli.BoxFactory(1, 0, boxcli.BoxStyles.ROUND, **kwargs)
+
+            factories = []
+
+            def render() -> None:
+                for i, factory in enumerate(factories):
+                    factory.get_box(f"Component {i}", "status: ok")
+
+            tracemalloc.start()
+            create = timed(lambda: factories.extend(make(i) for i in range(FACTORIES)))
+            first = timed(render)
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            later = timed(render)
+            out.seek(0)
+            out.truncate()
+
+            print(
+                f"{engine.name:<6} {name:<15} create {create:8.2f} ms "
+                f"first render {first:8.2f} ms later renders {later:8.2f} ms "
+                f"held {held / 1024:8.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark laying out a dashboard of boxes in a grid.
+
+Compares get_grid against rendering every box with get_box and
+stitching the rendered boxes together side by side, which has to
+measure the rendered lines through their escape codes, for both
+render engines.
+
+Run with ``python benchmarks/bench_grid.py``.
+"""
+
+import re
+import time
+
+from rich.console import Console
+from wcwidth import wcswidth
+
+import boxcli
+
+ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+COLUMNS = 6
+ROUNDS = 20
+
+ITEMS = [
+    (f"Node {i}", "\n".join(f"disk {j}: {(i * j) % 100}%" for j in range(i % 4 + 1)))
+    for i in range(48)
+]
+
+
+def visible_width(line: str) -> int:
+    """Returns the width of a rendered line, without its escape codes."""
+    return wcswidth(ESCAPE.sub("", line))
+
+
+def stitch(boxes: list, gap: int = 2) -> str:
+    """Joins rendered boxes side by side, the way it had to be done by hand."""
+    rows = []
+
+    for start in range(0, len(boxes), COLUMNS):
+        columns = [box.rstrip("\n").split("\n") for box in boxes[start:][:COLUMNS]]
+        widths = [max(visible_width(line) for line in c) for c in columns]
+        height = max(len(c) for c in columns)
+
+        for i in range(height):
+            parts = []
+            for lines, width in zip(columns, widths):
+                line = lines[i] if i < len(lines) else ""
+                parts.append(line + " " * (width - visible_width(line)))
+            rows.append((" " * gap).join(parts))
+
+        rows.append("")
+
+    return "\n".join(rows)
+
+
+def main() -> None:
+    for engine in boxcli.RenderEngine:
+        console = Console(width=200, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1,
+            0,
+            boxcli.BoxStyles.ROUND,
+            colour=boxcli.ColourEnum.GREEN,
+            engine=engine,
+            console=console,
+        )
+
+        runs = {
+            "get_box + stitch": lambda: stitch([factory.get_box(*i) for i in ITEMS]),
+            "get_grid": lambda: factory.get_grid(ITEMS, columns=COLUMNS),
+        }
+
+        for name, run in runs.items():
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                run()
+            ms = (time.perf_counter() - start) / ROUNDS * 1e3
+            print(f"{engine.name:<6} {name:<18} {ms:10.3f} ms/grid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark the bytes written to redraw a status box in place.
+
+A status box of 20 services is updated 1000 times, one service
+changes state on every update. Reprinting the whole box on every
+update is compared against a LiveBox, which only rewrites the lines
+that changed, for both render engines.
+
+Run with ``python benchmarks/bench_live.py``.
+"""
+
+import io
+import time
+
+from rich.console import Console
+
+import boxcli
+
+SERVICES = 20
+UPDATES = 1000
+
+
+class CountingWriter(io.StringIO):
+    """A stream that counts the bytes written to it and discards them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        self.bytes += len(text.encode("utf-8"))
+        return len(text)
+
+
+def statuses(update: int) -> str:
+    states = ["up  ", "down"]
+    return "\n".join(
+        f"service-{i:02}: {states[(update + i) % 7 == 0]}" for i in range(SERVICES)
+    )
+
+
+def reprint(factory: boxcli.BoxFactory, out: CountingWriter) -> None:
+    height = 0
+
+    for update in range(UPDATES):
+        box = factory.get_box("Status", statuses(update))
+
+        # Move back up over the previous box and print over it.
+        if height:
+            out.write(f"\x1b[{height}A\r")
+        out.write(box)
+        height = box.count("\n")
+
+
+def live(factory: boxcli.BoxFactory, out: CountingWriter) -> None:
+    with boxcli.LiveBox(factory, "Status", file=out, refresh_per_second=None) as box:
+        for update in range(UPDATES):
+            box.update(statuses(update))
+
+
+def main() -> None:
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1,
+            0,
+            boxcli.BoxStyles.ROUND,
+            colour=boxcli.RGB((0, 200, 120)),
+            engine=engine,
+            console=console,
+        )
+
+        for name, run in {"reprint": reprint, "LiveBox": live}.items():
+            out = CountingWriter()
+            start = time.perf_counter()
+            run(factory, out)
+            us = (time.perf_counter() - start) / UPDATES * 1e6
+            per_update = out.bytes / UPDATES
+            print(
+                f"{engine.name:<6} {name:<8} {per_update:10.1f} bytes/update "
+                f"{us:10.1f} us/update"
+            )
+
+
+if __name__ == "__main__":
+    main()
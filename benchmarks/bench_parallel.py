@@ -0,0 +1,43 @@
+"""Benchmark how rendering throughput scales with worker processes.
+
+Renders a large batch of boxes with get_boxes in the current process,
+then with get_boxes_parallel and an increasing amount of workers.
+Scaling is bounded by the amount of CPUs of the machine.
+
+Run with ``python benchmarks/bench_parallel.py``.
+"""
+
+import os
+import time
+
+import boxcli
+
+BOXES = 50_000
+
+PAIRS = [(f"Job {i}", f"state: done\nduration: {i % 60}s") for i in range(BOXES)]
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<22} {seconds:8.3f} s {BOXES / seconds:12.0f} boxes/s")
+
+
+def main() -> None:
+    print(f"{os.cpu_count()} CPU(s)")
+
+    for engine in boxcli.RenderEngine:
+        factory = boxcli.BoxFactory(
+            2, 0, boxcli.BoxStyles.SINGLE, colour=boxcli.ColourEnum.CYAN, engine=engine
+        )
+
+        start = time.perf_counter()
+        factory.get_boxes(PAIRS)
+        report(f"{engine.name} get_boxes", time.perf_counter() - start)
+
+        for processes in (1, 2, 4, 8):
+            start = time.perf_counter()
+            factory.get_boxes_parallel(PAIRS, processes=processes)
+            report(f"{engine.name} {processes} worker(s)", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark the plain engine for writing boxes to log files.
+
+Renders uncoloured boxes with every render engine, small job boxes
+and a box of a 2000 line log, and writes them to /dev/null three
+ways: encoding the output of get_box, with get_box_bytes, and with
+the buffers of get_box_buffers in a single os.writev call per box.
+The best of several runs is reported.
+
+Run with ``python benchmarks/bench_plain.py``.
+"""
+
+import os
+import timeit
+
+from rich.console import Console
+
+import boxcli
+
+CASES = {
+    "small": [(f"Job {i}", f"state: done\nduration: {i % 60}s") for i in range(1000)],
+    "log": [("Log", "\n".join(f"{i:>6} request served" for i in range(2000)))] * 10,
+}
+
+
+def main() -> None:
+    fd = os.open(os.devnull, os.O_WRONLY)
+
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system=None)
+        factory = boxcli.BoxFactory(
+            1, 0, boxcli.BoxStyles.SINGLE, engine=engine, console=console
+        )
+
+        def get_box(pairs: list) -> None:
+            for title, content in pairs:
+                os.write(fd, factory.get_box(title, content).encode("utf-8"))
+
+        def get_box_bytes(pairs: list) -> None:
+            for title, content in pairs:
+                os.write(fd, factory.get_box_bytes(title, content))
+
+        def writev(pairs: list) -> None:
+            for title, content in pairs:
+                os.writev(fd, factory.get_box_buffers(title, content))
+
+        runs = {"get_box": get_box, "get_box_bytes": get_box_bytes, "writev": writev}
+
+        for case, pairs in CASES.items():
+            for name, run in runs.items():
+                number = 1 if engine is boxcli.RenderEngine.RICH else 5
+                seconds = min(
+                    timeit.repeat(lambda: run(pairs), number=number, repeat=5)
+                )
+                per_box = seconds / number / len(pairs) * 1e6
+                print(f"{engine.name:<6} {case:<6} {name:<14} {per_box:10.2f} us/box")
+
+    os.close(fd)
+
+
+if __name__ == "__main__":
+    main()
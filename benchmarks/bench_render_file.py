@@ -0,0 +1,72 @@
+"""Benchmark boxing up large files with render_file.
+
+Generates report files of 10 MB and more, then boxes them up with
+render_file, and by reading the file into a string and writing the
+output of get_box. Peak Python memory is measured with tracemalloc,
+the memory mapped file itself is backed by the page cache.
+
+Run with ``python benchmarks/bench_render_file.py``.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import boxcli
+
+SIZES_MB = [10, 50]
+
+
+def write_report(path: str, size: int) -> None:
+    """Writes a report of about the given size in bytes."""
+    with open(path, "w", encoding="utf-8") as f:
+        written = i = 0
+        while written < size:
+            line = f"{i:>9} | service-{i % 97:<3} | status ok | 処理済み {i % 13}\n"
+            written += f.write(line)
+            i += 1
+
+
+def traced(function) -> tuple:
+    """Returns the seconds taken by a function and its peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    factory = boxcli.BoxFactory(
+        1, 0, boxcli.BoxStyles.SINGLE, engine=boxcli.RenderEngine.ANSI
+    )
+
+    with tempfile.TemporaryDirectory() as directory, open(
+        os.devnull, "w", encoding="utf-8"
+    ) as out:
+        for size in SIZES_MB:
+            path = os.path.join(directory, f"report-{size}.txt")
+            write_report(path, size * 1024 * 1024)
+
+            def read_and_get_box() -> None:
+                with open(path, encoding="utf-8") as f:
+                    out.write(factory.get_box("Report", f.read()))
+
+            runs = {
+                "read + get_box": read_and_get_box,
+                "render_file": lambda: factory.render_file(out, "Report", path),
+            }
+
+            for name, run in runs.items():
+                seconds, peak = traced(run)
+                print(
+                    f"{size:>4} MB {name:<15} {seconds:8.3f} s "
+                    f"peak {peak / 1024 / 1024:10.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark the peak memory of render_to against get_box.
+
+Renders boxes of growing size straight to a file with render_to, and
+by writing the string returned by get_box. The content itself is
+created before memory tracing starts, so only the memory used by
+rendering is measured.
+
+Run with ``python benchmarks/bench_render_to.py``.
+"""
+
+import os
+import time
+import tracemalloc
+
+import boxcli
+
+
+def traced(function) -> tuple:
+    """Returns the seconds taken by a function and its peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    factory = boxcli.BoxFactory(
+        2, 1, boxcli.BoxStyles.ROUND, engine=boxcli.RenderEngine.ANSI
+    )
+
+    with open(os.devnull, "w", encoding="utf-8") as text, open(
+        os.devnull, "wb"
+    ) as binary:
+        for lines in (1_000, 10_000, 100_000):
+            content = "\n".join(f"line {i} " * (i % 8 + 1) for i in range(lines))
+
+            runs = {
+                "get_box": lambda: text.write(factory.get_box("Box", content)),
+                "render_to text": lambda: factory.render_to(text, "Box", content),
+                "render_to binary": lambda: factory.render_to(binary, "Box", content),
+            }
+
+            for name, run in runs.items():
+                seconds, peak = traced(run)
+                print(
+                    f"{lines:>7} lines {name:<17} {seconds:8.3f} s "
+                    f"peak {peak / 1024:10.1f} KiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
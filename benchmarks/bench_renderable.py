@@ -0,0 +1,45 @@
+"""Benchmark embedding boxes in a rich layout.
+
+Prints a group of boxes through a rich console in two ways: rendering
+every box to a string with get_box and printing the strings, which
+renders every box twice, and printing the native renderables returned
+by get_renderable, which rich renders in a single pass.
+
+Run with ``python benchmarks/bench_renderable.py``.
+"""
+
+import io
+import time
+
+from rich.console import Console, RenderGroup
+
+import boxcli
+
+PAIRS = [(f"Worker {i}", f"jobs: {i * 7 % 50}\nqueue: {i % 9}") for i in range(200)]
+ROUNDS = 10
+
+
+def main() -> None:
+    console = Console(
+        file=io.StringIO(), width=120, force_terminal=True, color_system="truecolor"
+    )
+    factory = boxcli.BoxFactory(
+        1, 0, boxcli.BoxStyles.ROUND, colour=boxcli.ColourEnum.CYAN, console=console
+    )
+
+    def strings() -> None:
+        console.print(RenderGroup(*[factory.get_box(*pair) for pair in PAIRS]))
+
+    def renderables() -> None:
+        console.print(RenderGroup(*[factory.get_renderable(*pair) for pair in PAIRS]))
+
+    for name, run in {"get_box": strings, "get_renderable": renderables}.items():
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            run()
+        ms = (time.perf_counter() - start) / ROUNDS * 1e3
+        print(f"{name:<15} {ms:10.3f} ms per {len(PAIRS)} boxes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the per-call cost of rendering many small boxes.
+
+Every box is rendered by the same factory, which is the case the
+compiled factory template is meant to speed up. The ``recompiled``
+column rebuilds the template before every box, which is what every
+call used to pay for. Both render engines are measured.
+
+Run with ``python benchmarks/bench_small_boxes.py``.
+"""
+
+import itertools
+import timeit
+
+import boxcli
+
+NUMBER = 2000
+
+STATUSES = [f"worker-{i}\nstatus: ok\nqueue: {i * 7}" for i in range(16)]
+
+
+def render_many(factory: boxcli.BoxFactory, recompile: bool) -> None:
+    for status in STATUSES:
+        if recompile:
+            factory._compile()
+        factory.get_box("Status", status)
+
+
+def main() -> None:
+    print(f"{'engine':<6} {'position':<8} {'compiled':>14} {'recompiled':>14}")
+    for engine, title_pos in itertools.product(
+        boxcli.RenderEngine, boxcli.TitlePosition
+    ):
+        factory = boxcli.BoxFactory(
+            2,
+            1,
+            boxcli.BoxStyles.ROUND,
+            title_pos=title_pos,
+            colour=boxcli.ColourEnum.GREEN,
+            engine=engine,
+        )
+        timings = []
+        for recompile in (False, True):
+            seconds = timeit.timeit(
+                lambda: render_many(factory, recompile), number=NUMBER // 16
+            )
+            timings.append(seconds / NUMBER * 1e6)
+        print(
+            f"{engine.name:<6} {title_pos.name:<8} "
+            f"{timings[0]:8.2f} us/box {timings[1]:8.2f} us/box"
+        )
+
+
+if __name__ == "__main__":
+    main()
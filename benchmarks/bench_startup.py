@@ -0,0 +1,90 @@
+"""Benchmark the startup cost of boxcli for short-lived CLI tools.
+
+Measures the time taken by ``import boxcli`` with ``python -X importtime``,
+and the time taken by a fresh process to import boxcli and render its
+first box with each render engine. Every measurement runs in a new
+interpreter, and the best of several runs is reported.
+
+Importing boxcli must not import rich or wcwidth, those are only
+imported once a box is rendered, and the plain engine never imports
+rich. Pass ``--max-import-ms`` and
+``--max-render-ms`` to fail when the startup cost regresses.
+
+Run with ``python benchmarks/bench_startup.py``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+RUNS = 10
+
+FIRST_RENDER = """
+import sys
+import time
+start = time.perf_counter()
+import boxcli
+engine = boxcli.RenderEngine.{0}
+factory = boxcli.BoxFactory(2, 1, boxcli.BoxStyles.ROUND, engine=engine)
+factory.get_box("Status", "All systems go")
+print(time.perf_counter() - start)
+if "{0}" == "PLAIN" and "rich" in sys.modules:
+    raise SystemExit("the plain engine imported rich")
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_time() -> float:
+    """Returns the cumulative import time of boxcli in milliseconds."""
+    stderr = run_python("-X", "importtime", "-c", "import boxcli").stderr
+    modules = {}
+
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative) / 1000
+
+    for eager in ("rich", "wcwidth"):
+        if eager in modules:
+            raise SystemExit(f"import boxcli imported {eager}")
+
+    return modules["boxcli"]
+
+
+def first_render_time(engine: str) -> float:
+    """Returns the time to import boxcli and render a box in milliseconds."""
+    return float(run_python("-c", FIRST_RENDER.format(engine)).stdout) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-render-ms", type=float)
+    args = parser.parse_args()
+
+    failed = False
+
+    best = min(import_time() for _ in range(RUNS))
+    print(f"import boxcli          {best:8.2f} ms")
+    if args.max_import_ms is not None and best > args.max_import_ms:
+        failed = True
+
+    for engine in ("RICH", "ANSI", "PLAIN"):
+        best = min(first_render_time(engine) for _ in range(RUNS))
+        print(f"first render ({engine:<5})  {best:8.2f} ms")
+        if args.max_render_ms is not None and best > args.max_render_ms:
+            failed = True
+
+    if failed:
+        raise SystemExit("startup cost exceeded the budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the cost of render statistics.
+
+Renders small boxes with get_box with statistics disabled and
+enabled, against rendering them straight from the template, which
+is what get_box does without the statistics check. The collected
+statistics are printed as JSON.
+
+Run with ``python benchmarks/bench_stats.py``.
+"""
+
+import json
+import timeit
+
+from rich.console import Console
+
+import boxcli
+
+PAIRS = [(f"Job {i}", f"state: done\nduration: {i % 60}s") for i in range(100)]
+
+
+def main() -> None:
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1, 0, boxcli.BoxStyles.SINGLE, engine=engine, console=console
+        )
+        template = factory._get_template()
+
+        def direct() -> None:
+            for title, content in PAIRS:
+                template.engine.render(template.layout(title, content))
+
+        def get_box() -> None:
+            for title, content in PAIRS:
+                factory.get_box(title, content)
+
+        number = 20 if engine is boxcli.RenderEngine.RICH else 500
+        runs = [("template", direct), ("stats off", get_box)]
+
+        for name, run in runs:
+            seconds = min(timeit.repeat(run, number=number, repeat=5))
+            per_box = seconds / number / len(PAIRS) * 1e6
+            print(f"{engine.name:<6} {name:<10} {per_box:8.3f} us/box")
+
+        stats = factory.enable_stats()
+        seconds = min(timeit.repeat(get_box, number=number, repeat=5))
+        per_box = seconds / number / len(PAIRS) * 1e6
+        print(f"{engine.name:<6} {'stats on':<10} {per_box:8.3f} us/box")
+        print(json.dumps(stats.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark streaming an unbounded amount of lines through a box.
+
+Shows that the peak memory of BoxFactory.stream stays the same no
+matter how many lines are streamed, unlike get_box which needs the
+whole content up front.
+
+Run with ``python benchmarks/bench_stream.py``.
+"""
+
+import time
+import tracemalloc
+
+import boxcli
+
+
+def log_lines(count: int):
+    for i in range(count):
+        yield f"2020-05-07 16:13:{i % 60:02} INFO processed request {i}\n"
+
+
+def main() -> None:
+    factory = boxcli.BoxFactory(
+        1, 0, boxcli.BoxStyles.SINGLE, engine=boxcli.RenderEngine.ANSI
+    )
+
+    for count in (1_000, 10_000, 100_000):
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in factory.stream("Log", log_lines(count), width=60):
+            pass
+        seconds = time.perf_counter() - start
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        factory.get_box("Log", "".join(log_lines(count)))
+        _, box_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{count:>7} lines  stream {seconds:6.3f} s  "
+            f"stream peak {stream_peak / 1024:8.1f} KiB  "
+            f"get_box peak {box_peak / 1024:8.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Stress test and benchmark a BoxFactory shared by several threads.
+
+The stress test renders boxes from several threads with one shared
+factory while another thread keeps switching the factory between two
+sets of settings with update(). Every rendered box must be exactly
+the box of one of the two settings, it exits with status 1 otherwise.
+
+The benchmark measures rendering throughput as the amount of threads
+sharing the factory grows.
+
+Run with ``python benchmarks/bench_threads.py``.
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+
+import boxcli
+
+SETTINGS = [
+    {
+        "Px": 1,
+        "Py": 0,
+        "style": boxcli.BoxStyles.SINGLE,
+        "colour": boxcli.ColourEnum.RED,
+        "alignment": boxcli.ContentAlignment.LEFT,
+    },
+    {
+        "Px": 3,
+        "Py": 2,
+        "style": boxcli.BoxStyles.DOUBLE,
+        "colour": boxcli.RGB((0, 128, 255)),
+        "alignment": boxcli.ContentAlignment.RIGHT,
+    },
+]
+
+PAIRS = [(f"Job {i}", f"state: running\nstep {i} of 100") for i in range(100)]
+
+
+def make_factory(engine: boxcli.RenderEngine) -> boxcli.BoxFactory:
+    console = Console(width=120, force_terminal=True, color_system="truecolor")
+    factory = boxcli.BoxFactory(0, 0, boxcli.BoxStyles.ROUND, engine=engine)
+    factory.console = console
+    return factory
+
+
+def stress(engine: boxcli.RenderEngine, threads: int, seconds: float) -> int:
+    """Returns the amount of boxes that didn't match either settings."""
+    factory = make_factory(engine)
+
+    expected = []
+    for settings in SETTINGS:
+        factory.update(**settings)
+        expected.append({pair: factory.get_box(*pair) for pair in PAIRS})
+
+    stop = threading.Event()
+    failures = []
+
+    def render() -> None:
+        while not stop.is_set():
+            for pair in PAIRS:
+                box = factory.get_box(*pair)
+                if box != expected[0][pair] and box != expected[1][pair]:
+                    failures.append(box)
+
+    def toggle() -> None:
+        while not stop.is_set():
+            for settings in SETTINGS:
+                factory.update(**settings)
+                time.sleep(0.0005)
+
+    # Switch threads as often as possible to widen any race windows.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    workers = [threading.Thread(target=render) for _ in range(threads)]
+    workers.append(threading.Thread(target=toggle))
+
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    sys.setswitchinterval(interval)
+    return len(failures)
+
+
+def throughput(engine: boxcli.RenderEngine, threads: int) -> float:
+    """Returns the amount of boxes rendered per second."""
+    factory = make_factory(engine)
+    factory.update(**SETTINGS[0])
+    rounds = 20 if engine is boxcli.RenderEngine.RICH else 200
+
+    def render(_) -> None:
+        for _ in range(rounds):
+            for pair in PAIRS:
+                factory.get_box(*pair)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(render, range(threads)))
+    seconds = time.perf_counter() - start
+
+    return threads * rounds * len(PAIRS) / seconds
+
+
+def main() -> None:
+    failed = False
+
+    for engine in boxcli.RenderEngine:
+        failures = stress(engine, threads=8, seconds=3)
+        print(f"{engine.name:<5} stress: {failures} mismatched box(es)")
+        failed = failed or failures > 0
+
+        for threads in (1, 2, 4, 8, 16):
+            rate = throughput(engine, threads)
+            print(f"{engine.name:<5} {threads:>2} thread(s) {rate:12.0f} boxes/s")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
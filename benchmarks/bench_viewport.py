@@ -0,0 +1,51 @@
+"""Benchmark scrolling through a huge box in a pager.
+
+Renders a 40 line window of a box of a million lines at 200 offsets,
+once with get_box for the whole box, and with a viewport, for every
+render engine. Creating the viewport, which splits and measures the
+content once, is timed separately from scrolling.
+
+Run with ``python benchmarks/bench_viewport.py``.
+"""
+
+import time
+
+from rich.console import Console
+
+import boxcli
+
+LINES = 1_000_000
+WINDOW = 40
+OFFSETS = range(0, LINES, LINES // 200)
+
+
+def main() -> None:
+    content = "\n".join(f"{i:>8} GET /api/items/{i % 977} 200" for i in range(LINES))
+
+    for engine in boxcli.RenderEngine:
+        console = Console(width=120, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1, 0, boxcli.BoxStyles.ROUND, engine=engine, console=console
+        )
+
+        # Rich takes a long time for a million lines, render it once.
+        if engine is not boxcli.RenderEngine.RICH:
+            start = time.perf_counter()
+            factory.get_box("Access log", content)
+            seconds = time.perf_counter() - start
+            print(f"{engine.name:<6} get_box          {seconds * 1e3:12.2f} ms")
+
+        start = time.perf_counter()
+        viewport = factory.get_viewport("Access log", content)
+        seconds = time.perf_counter() - start
+        print(f"{engine.name:<6} get_viewport     {seconds * 1e3:12.2f} ms")
+
+        start = time.perf_counter()
+        for offset in OFFSETS:
+            viewport.render(offset, WINDOW)
+        seconds = (time.perf_counter() - start) / len(OFFSETS)
+        print(f"{engine.name:<6} render window    {seconds * 1e3:12.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
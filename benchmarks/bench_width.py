@@ -0,0 +1,57 @@
+"""Benchmark width measurement for ASCII, CJK and emoji content.
+
+Compares measuring every line with wcwidth, the way get_box used to,
+against the shared width measurement layer in boxcli.width, and
+shows the effect on rendering a whole box.
+
+Run with ``python benchmarks/bench_width.py``.
+"""
+
+import timeit
+
+from wcwidth import wcswidth
+
+import boxcli
+from boxcli.width import measure_lines
+
+SCRIPTS = {
+    "ascii": "the quick brown fox jumps over the lazy dog {}",
+    "cjk": "敏捷的棕色狐狸跳过了懒狗 {}",
+    "emoji": "🦊 jumps over 🐶 and 🎉 {}",
+}
+
+# Many lines of real content repeat, so only 100 distinct lines.
+LINES = 5000
+DISTINCT = 100
+
+
+def measure_with_wcwidth(lines):
+    longest = 0
+    for line in lines:
+        if wcswidth(line) > longest:
+            longest = wcswidth(line)
+    return [wcswidth(line) for line in lines], longest
+
+
+def main() -> None:
+    factory = boxcli.BoxFactory(
+        1, 0, boxcli.BoxStyles.SINGLE, engine=boxcli.RenderEngine.ANSI
+    )
+
+    for script, template in SCRIPTS.items():
+        lines = [template.format(i % DISTINCT) for i in range(LINES)]
+        content = "\n".join(lines)
+
+        old = timeit.timeit(lambda: measure_with_wcwidth(lines), number=10) / 10
+        new = timeit.timeit(lambda: measure_lines(lines), number=10) / 10
+        box = timeit.timeit(lambda: factory.get_box("Box", content), number=10) / 10
+
+        print(
+            f"{script:<6} wcwidth {old * 1e3:8.2f} ms  "
+            f"boxcli.width {new * 1e3:8.2f} ms  "
+            f"get_box {box * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
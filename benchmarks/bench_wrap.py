@@ -0,0 +1,68 @@
+"""Benchmark wrapping very long content lines.
+
+Renders boxes with a single line of a megabyte of JSON, a stack trace
+with long frames and a long line of CJK text, with the plain engine,
+once without a maximum width and once wrapped to 120 columns. The
+lines are then wrapped on their own at several widths, to check that
+wrapping takes time linear in the length of the line and not in the
+amount of pieces it is wrapped into.
+
+Run with ``python benchmarks/bench_wrap.py``.
+"""
+
+import json
+import time
+
+import boxcli
+from boxcli.width import wrap_line
+
+REPEAT = 5
+
+CONTENTS = {
+    "json-1mb": json.dumps(
+        [{"id": i, "name": f"item {i}", "tags": ["a", "b", "c"]} for i in range(20_000)]
+    ),
+    "stack-trace": "\n".join(
+        f'  File "/srv/app/{"module/" * 30}handler_{i}.py", line {i}, in {"x" * 400}'
+        for i in range(2_000)
+    ),
+    "cjk-line": "日本語のテキストと 漢字 " * 20_000,
+}
+
+
+def best(function) -> float:
+    """Returns the lowest time of several calls of a function."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    for name, content in CONTENTS.items():
+        for max_width in (0, 120):
+            factory = boxcli.BoxFactory(
+                1,
+                0,
+                boxcli.BoxStyles.ROUND,
+                engine=boxcli.RenderEngine.PLAIN,
+                max_width=max_width,
+            )
+            seconds = best(lambda: factory.get_box("Log", content))
+            label = f"{name} max_width={max_width}"
+            print(f"{label:<28} get_box   {seconds * 1e3:10.2f} ms")
+
+    for name, content in CONTENTS.items():
+        line = max(content.splitlines(), key=len)
+
+        for width in (20, 120, 1000):
+            seconds = best(lambda: wrap_line(line, width))
+            label = f"{name} width={width}"
+            rate = len(line) / seconds / 1e6
+            print(f"{label:<28} wrap_line {seconds * 1e3:10.2f} ms {rate:8.1f} Mchar/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Regression checks for markup that spans the lines of a box.
+
+Writes boxes whose markup is opened on one line and closed on a later
+one with the rich engine, a chunk of lines at a time, and checks that
+what is written is the same as the output of get_box for every chunk
+size. Streamed boxes are rendered a line at a time. Hyperlinks get a
+new id every time they are rendered, so the ids are left out of the
+comparison. Exits with status 1 if a check fails::
+
+    python benchmarks/markup.py
+"""
+
+import asyncio
+import io
+import os
+import re
+import sys
+import tempfile
+from typing import Callable, Iterator, Tuple
+
+from rich.console import Console
+
+import boxcli
+from boxcli.width import line_width
+
+CONTENTS = [
+    "[bold]first\nsecond[/bold]",
+    "[red]a\n[b]b[/red]\nc[/b]\n[link=https://example.com]l\nk[/link]",
+    "x [green]1\n2\n3\n4\n5 \\[y] 6[/]\n7 [bold italic]8\n9",
+    "[red on white]x\n\n\ny",
+]
+
+CHUNK_SIZES = [1, 2, 3, 100]
+
+LINK_IDS = re.compile(r"id=[0-9.]+-[0-9]+;")
+
+
+def render_to(factory: boxcli.BoxFactory, content: str, chunk_size: int) -> str:
+    output = io.StringIO()
+    factory.render_to(output, "T", content, chunk_size)
+    return output.getvalue()
+
+
+def render_file(factory: boxcli.BoxFactory, content: str, chunk_size: int) -> str:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "content.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+        output = io.StringIO()
+        factory.render_file(output, "T", path, chunk_size=chunk_size)
+        return output.getvalue()
+
+
+class BufferWriter:
+    """A stream writer that keeps what is written in a buffer."""
+
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def write(self, data: bytes) -> None:
+        self.buffer.write(data)
+
+    async def drain(self) -> None:
+        pass
+
+
+def write_box_async(factory: boxcli.BoxFactory, content: str, chunk_size: int) -> str:
+    writer = BufferWriter()
+    asyncio.run(factory.write_box_async(writer, "T", content, chunk_size))
+    return writer.buffer.getvalue().decode("utf-8")
+
+
+def stream(factory: boxcli.BoxFactory, content: str, chunk_size: int) -> str:
+    # A box streamed as wide as its widest line is laid out like get_box
+    # lays it out, every line is streamed on its own.
+    lines = content.splitlines()
+    width = max(line_width(line, markup=True) for line in lines + ["T"])
+    return "".join(factory.stream("T", lines, width)) + "\n"
+
+
+WRITERS = {
+    "render_to": render_to,
+    "render_file": render_file,
+    "write_box_async": write_box_async,
+    "stream": stream,
+}
+
+
+def cases() -> Iterator[Tuple[str, boxcli.BoxFactory, str, int, Callable]]:
+    """Yields the name, factory, content, chunk size and writer of every case."""
+    for position in boxcli.TitlePosition:
+        console = Console(width=80, force_terminal=True, color_system="truecolor")
+        factory = boxcli.BoxFactory(
+            1, 1, boxcli.BoxStyles.ROUND, title_pos=position, console=console
+        )
+
+        for i, content in enumerate(CONTENTS):
+            for chunk_size in CHUNK_SIZES:
+                for name, writer in WRITERS.items():
+                    case = f"{name} {position.name.lower()} #{i} chunk {chunk_size}"
+                    yield case, factory, content, chunk_size, writer
+
+
+def main() -> None:
+    failures = 0
+
+    for case, factory, content, chunk_size, writer in cases():
+        expected = LINK_IDS.sub("", factory.get_box("T", content))
+
+        try:
+            written = LINK_IDS.sub("", writer(factory, content, chunk_size))
+        except Exception as e:
+            print(f"{case} raised {type(e).__name__}: {e}")
+            failures += 1
+            continue
+
+        if written != expected:
+            print(f"{case} is not the same as get_box")
+            failures += 1
+
+    if failures:
+        print(f"{failures} markup check(s) failed")
+        sys.exit(1)
+
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
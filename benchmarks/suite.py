@@ -0,0 +1,207 @@
+"""Reproducible benchmark suite for BoxFactory.get_box.
+
+The suite runs offline and covers every box style, every combination
+of content alignment and title position, coloured and uncoloured
+boxes, content from 1 to 100k lines, and ASCII, CJK and emoji text,
+with every render engine. Content is generated deterministically and
+consoles are created with a fixed width and colour system, so the
+results don't depend on the terminal the suite is run from.
+
+Run the suite and write the results to a JSON file::
+
+    python benchmarks/suite.py run --output results.json
+
+Compare two runs, exiting with status 1 if a case got slower by
+more than the threshold::
+
+    python benchmarks/suite.py compare before.json after.json --threshold 0.1
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, Iterator, Tuple
+
+from rich.console import Console
+
+import boxcli
+
+SIZES = [1, 10, 100, 1_000, 10_000, 100_000]
+
+SCRIPTS = {
+    "ascii": "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "cjk": "敏捷的棕色狐狸跳过了懒狗日本語テキスト한국어텍스트",
+    "emoji": "🦊🐶🎉🚀🔥✨🌈🍰 ",
+}
+
+COLOURS = {
+    "uncoloured": None,
+    "colour-enum": boxcli.ColourEnum.MAGENTA,
+    "rgb": boxcli.RGB((255, 128, 0)),
+}
+
+CONSOLE_WIDTH = 200
+
+
+def make_content(script: str, lines: int) -> str:
+    """Returns deterministic content of the given script and size."""
+    rng = random.Random(f"{script}-{lines}")
+    alphabet = SCRIPTS[script]
+    return "\n".join(
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(10, 40)))
+        for _ in range(lines)
+    )
+
+
+def make_factory(engine, colour_name: str, **kwargs) -> boxcli.BoxFactory:
+    """Returns a factory rendering to a fixed, offline console."""
+    colour = COLOURS[colour_name]
+
+    # Colour can't be turned off on a factory, so uncoloured boxes
+    # are rendered to a console without a colour system.
+    console = Console(
+        width=CONSOLE_WIDTH,
+        force_terminal=True,
+        color_system=None if colour is None else "truecolor",
+    )
+
+    if colour is not None:
+        kwargs["colour"] = colour
+
+    return boxcli.BoxFactory(2, 1, engine=engine, console=console, **kwargs)
+
+
+def cases(max_lines: int) -> Iterator[Tuple[str, Callable[[], str]]]:
+    """Yields the name and the benchmarked function of every case."""
+    medium = make_content("ascii", 100)
+    sizes = [size for size in SIZES if size <= max_lines]
+
+    for engine in boxcli.RenderEngine:
+        prefix = engine.name.lower()
+
+        for style in boxcli.BoxStyles:
+            factory = make_factory(engine, "colour-enum", style=style)
+            yield f"{prefix}/style/{style.name.lower()}", _case(factory, medium)
+
+        for alignment, title_pos in itertools.product(
+            boxcli.ContentAlignment, boxcli.TitlePosition
+        ):
+            factory = make_factory(
+                engine,
+                "colour-enum",
+                style=boxcli.BoxStyles.ROUND,
+                alignment=alignment,
+                title_pos=title_pos,
+            )
+            name = f"{alignment.name.lower()}-{title_pos.name.lower()}"
+            yield f"{prefix}/layout/{name}", _case(factory, medium)
+
+        for colour_name, script, size in itertools.product(COLOURS, SCRIPTS, sizes):
+            factory = make_factory(engine, colour_name, style=boxcli.BoxStyles.SINGLE)
+            content = make_content(script, size)
+            name = f"{prefix}/content/{colour_name}/{script}/{size}"
+            yield name, _case(factory, content)
+
+
+def _case(factory: boxcli.BoxFactory, content: str) -> Callable[[], str]:
+    return lambda: factory.get_box("Benchmark", content)
+
+
+def measure(function: Callable[[], str], repeat: int) -> Dict[str, float]:
+    """Returns timings of a function in seconds per call."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [seconds / number for seconds in timer.repeat(repeat, number)]
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    results = {}
+
+    for name, function in cases(args.max_lines):
+        if args.filter and args.filter not in name:
+            continue
+
+        results[name] = measure(function, args.repeat)
+        print(f"{name:<48} {results[name]['median'] * 1e3:12.4f} ms", flush=True)
+
+    output = {
+        "meta": {
+            "boxcli": boxcli.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(output, f, indent=2, sort_keys=True)
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.before) as f:
+        before = json.load(f)["results"]
+    with open(args.after) as f:
+        after = json.load(f)["results"]
+
+    regressions = 0
+
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name]["median"], after[name]["median"]
+        change = new / old - 1
+        flag = ""
+
+        if change > args.threshold:
+            flag = "REGRESSION"
+            regressions += 1
+
+        print(
+            f"{name:<48} {old * 1e3:12.4f} ms {new * 1e3:12.4f} ms "
+            f"{change:+8.1%} {flag}"
+        )
+
+    for name in sorted(before.keys() ^ after.keys()):
+        print(f"{name:<48} only in {'before' if name in before else 'after'}")
+
+    if regressions:
+        print(f"{regressions} case(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--max-lines", type=int, default=SIZES[-1])
+    run_parser.add_argument("--filter", help="only run cases containing this")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
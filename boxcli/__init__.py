@@ -7,8 +7,14 @@ boxes in the terminal with ease.
 """
 
 from .box import *
+from .builder import BoxBuilder
+from .cache import RenderCache
 from .errors import TitleLengthError, TitlePositionError
+from .live import LiveBox
+from .renderable import BoxRenderable
+from .stats import RenderStats
 from .styles import RawStyle, RGB
+from .viewport import BoxViewport
 
 __all__ = [
     "BoxFactory",
@@ -20,6 +26,13 @@ __all__ = [
     "RawStyle",
     "RGB",
     "ColourEnum",
+    "RenderEngine",
+    "LiveBox",
+    "RenderStats",
+    "RenderCache",
+    "BoxRenderable",
+    "BoxViewport",
+    "BoxBuilder",
 ]
 
 __title__ = "boxcli"
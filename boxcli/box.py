@@ -1,34 +1,109 @@
+import codecs
 import enum
-from typing import List, Union
-
-from rich.console import Console
-from wcwidth import wcswidth
-
+import io
+import itertools
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .cache import RenderCache
+from .consoles import get_console
+from .engines import AnsiEngine, PlainEngine, RichEngine, _open_tags
 from .errors import TitleLengthError, TitlePositionError
+from .stats import RenderStats
 from .styles import RGB, RawStyle, alignments, colours_list, default_styles
+from .width import line_width, measure_lines, wrap_line
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from rich.console import Console
 
-__all__ = ["BoxStyles", "ContentAlignment", "TitlePosition", "BoxFactory", "ColourEnum"]
+    from .builder import BoxBuilder
+    from .renderable import BoxRenderable
+    from .viewport import BoxViewport
 
+__all__ = [
+    "BoxStyles",
+    "ContentAlignment",
+    "TitlePosition",
+    "BoxFactory",
+    "ColourEnum",
+    "RenderEngine",
+]
 
-def _longest_line(lines: List[str]) -> int:
-    """Returns the length of the longest line.
+
+def _iter_lines(text: str, block_size: int = 1 << 16) -> Iterator[str]:
+    """Yields the lines of a text one at a time.
+
+    This splits the text exactly like str.splitlines, a block of
+    the text at a time, without building a list of every line.
 
     Arguments
     ---------
-    lines : list[str]
-        A list of lines
+    text : str
+        The text to split.
+    block_size : int
+        The minimum size of a block.
+
+    Yields
+    ------
+    str
+        The lines of the text, without line boundaries."""
+
+    start = 0
+    length = len(text)
+
+    while start < length:
+        # Blocks end right after a newline, which never splits a line
+        # boundary, "\r\n" included, across two blocks.
+        end = text.find("\n", start + block_size)
+        end = length if end == -1 else end + 1
+
+        yield from text[start:end].splitlines()
+        start = end
+
+
+def _chunks(rows: Iterator[str], chunk_size: int) -> Iterator[str]:
+    """Yields the laid out lines of a box joined a chunk at a time."""
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield "\n".join(chunk)
+
 
-    Returns
-    -------
-    int
-        The length of the longest line."""
+def _is_binary(fp: IO) -> bool:
+    """Returns whether a stream is written bytes rather than text.
 
-    longest = 0
+    Streams that are neither io text nor binary streams, such as
+    spooled temporary files, are binary only if their mode says so."""
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(fp, io.TextIOBase):
+        return False
+    return "b" in str(getattr(fp, "mode", ""))
 
-    for line in lines:
-        if wcswidth(line) > longest:
-            longest = wcswidth(line)
-    return longest
+
+@lru_cache(maxsize=16)
+def _encodes_in_parts(encoding: str) -> bool:
+    """Returns whether text encoded in parts is the same as encoded at once."""
+    return codecs.encode("a", encoding) + codecs.encode("b", encoding) == codecs.encode(
+        "ab", encoding
+    )
 
 
 class BoxStyles(enum.Enum):
@@ -145,10 +220,44 @@ class ColourEnum(enum.Enum):
     WHITE = 8
 
 
-class BoxFactory:
-    """Represents a Box factory.
+class RenderEngine(enum.Enum):
+    """Render engine enumeration, to be used to specify how boxes are rendered.
 
-    This class can be used to create terminal boxes with ease.
+    Attributes
+    ----------
+    RICH : RenderEngine
+        Renders boxes through rich. Markup in the title and content
+        is processed, and lines wider than the console are wrapped.
+    ANSI : RenderEngine
+        Writes the escape codes of the border colour directly,
+        bypassing rich's markup parsing. The title and content
+        are written as they are, without the highlighting of
+        numbers, booleans and brackets that rich adds.
+    PLAIN : RenderEngine
+        Writes plain text without colour, and never imports rich.
+        The title and content are written as they are.
+    """
+
+    RICH = 1
+    ANSI = 2
+    PLAIN = 3
+
+
+# render engines
+render_engines = {
+    1: RichEngine,
+    2: AnsiEngine,
+    3: PlainEngine,
+}
+
+
+class BoxTemplate:
+    """Represents a compiled box template.
+
+    A template is compiled once from the settings of a BoxFactory and
+    holds every part of a box that does not depend on the width of
+    the box. The width dependent parts are computed when a box is
+    rendered, and memoized for the most recently used widths.
 
     Arguments
     ---------
@@ -156,108 +265,197 @@ class BoxFactory:
         Horizontal padding.
     Py : int
         Vertical padding.
-    style : Union[BoxStyles, RawStyle]
+    style : RawStyle
         The style used to construct boxes.
-        You can pass in a BoxStyles enum for builtin styles.
-        or use boxcli.RawStyle to specify a custom one.
-
-    Keyword Arguments
-    -----------------
     alignment : ContentAlignment
         The alignment used to construct boxes.
-        Defaults to ContentAlignment.CENTRE
-    title_pos : TitlePosition
+    title_position : TitlePosition
         The position of the title with respect to the box.
-        Defaults to TitlePosition.INSIDE
-    colour : Union[ColourEnum, RGB]
-        The colour to be used to construct the box border.
-        Defaults to white colour.
+    engine : Union[RichEngine, AnsiEngine, PlainEngine]
+        The engine used to colour the box border.
+    max_width : int
+        The maximum width of a box, content lines that don't fit
+        are wrapped, or 0 for no maximum.
+        Defaults to 0
     """
 
-    def __init__(self, Px: int, Py: int, style: Union[BoxStyles, RawStyle], **kwargs):
-        """The constructor nothing to explain here."""
+    # The maximum amount of box widths whose bars and padding lines
+    # are memoized at a time.
+    max_widths = 64
+
+    def __init__(
+        self,
+        Px: int,
+        Py: int,
+        style: RawStyle,
+        alignment: "ContentAlignment",
+        title_position: "TitlePosition",
+        engine: Union[RichEngine, AnsiEngine, PlainEngine],
+        max_width: int = 0,
+    ) -> None:
         self.Px = Px
         self.Py = Py
+        self.style = style
+        self.alignment = alignment
+        self.title_position = title_position
+        self.engine = engine
+        self.max_width = max_width
 
-        if isinstance(style, BoxStyles):
-            self.style = default_styles.get(style.value)
-        else:
-            self.style = style
+        # Markup processed by the engine takes up no cells.
+        self.markup = engine.markup
 
-        self.alignment = kwargs.get("alignment", ContentAlignment.CENTRE)
-        self.title_position = kwargs.get("title_pos", TitlePosition.INSIDE)
+        # The maximum width of a content line, a line is always
+        # at least a cell wide however small the box is.
+        self.wrap_width = max(max_width - (Px * 2) - 2, 1) if max_width else 0
 
-        colour = kwargs.get("colour", ColourEnum.WHITE)
+        self._paint = engine.paint
+        self.inside = title_position == TitlePosition.INSIDE
 
-        if isinstance(colour, ColourEnum):
-            self.colour = colours_list.get(colour.value)
-        elif isinstance(colour, RGB):
-            self.colour = colour.rgb
+        # side_margin here refers to the horizontal padding.
+        self.side_margin = " " * Px
+        self.sep = self._paint(style.vertical)
+
+        # The separators and the horizontal padding are the same for
+        # every line of every box, so bake them into the format string.
+        escaped_sep = self.sep.replace("{", "{{").replace("}", "}}")
+        self.fmt = (
+            alignments[alignment.value]
+            .replace("{sep}", escaped_sep)
+            .replace("{px}", self.side_margin)
+        )
+
+        # The corners used when the title is a part of the top or bottom bar.
+        if title_position == TitlePosition.TOP:
+            self.title_left = self._paint(style.top_left)
+            self.title_right = self._paint(style.top_right)
         else:
-            self.colour = colours_list.get(ColourEnum.WHITE.value)
+            self.title_left = self._paint(style.bottom_left)
+            self.title_right = self._paint(style.bottom_right)
 
-        self.console = Console()
+        self._widths: Dict[int, Tuple[str, str, List[str]]] = {}
+        self._encoded: Dict[Tuple[int, str], Tuple[bytes, bytes]] = {}
 
-    def _add_vert_padding(self, length: int) -> list:
-        """Returns a list of lines with vertical separators.
+    def _width_parts(self, n: int) -> Tuple[str, str, List[str]]:
+        """Returns the top bar, bottom bar and padding lines for a box width.
 
-        The amount of lines returned corresponds to the
-        vertical padding value.
+        Arguments
+        ---------
+        n : int
+            Computed width of the box.
+
+        Returns
+        -------
+        tuple[str, str, list[str]]
+            The top bar, the bottom bar and the vertical padding lines.
+        """
+        parts = self._widths.get(n)
+
+        if parts is None:
+            if len(self._widths) >= self.max_widths:
+                self._widths.clear()
+
+            bar = self.style.horizontal * (n - 2)
+            top_bar = self._paint(self.style.top_left + bar + self.style.top_right)
+            bottom_bar = self._paint(
+                self.style.bottom_left + bar + self.style.bottom_right
+            )
+
+            # Here note that the two we subtract corresponds to the
+            # end separators.
+            padding = [self.sep + " " * (n - 2) + self.sep] * self.Py
+
+            parts = (top_bar, bottom_bar, padding)
+            self._widths[n] = parts
+
+        return parts
+
+    def bars(self, n: int, title: str, title_width: int) -> Tuple[str, str]:
+        """Returns the top and bottom bars of a box.
 
         Arguments
         ---------
-        length : int
-            Length of the longest line.
+        n : int
+            Computed width of the box.
+        title : str
+            The title of the box.
+        title_width : int
+            The width of the title.
 
         Returns
         -------
-        list[str]
-            Lines equvivalent in number to the vertical padding,
-            with end separators.
+        tuple[str, str]
+            The top bar and the bottom bar.
         """
-        # Here note that the two we subtract corresponds to the
-        # end separators.
-        padding = " " * (length - 2)
-        lines = []
+        top_bar, bottom_bar, _ = self._width_parts(n)
 
-        if self.colour is not None:
-            sep = f"[{self.colour}]{self.style.vertical}[/{self.colour}]"
-        else:
-            sep = self.style.vertical
+        if self.inside:
+            return top_bar, bottom_bar
 
-        for _ in range(self.Py):
-            lines.append(sep + padding + sep)
-        return lines
+        # The title replaces the horizontal separators of one of the bars.
+        count = n - title_width - 4
+        title_bar = (
+            self.title_left
+            + f" {title} "
+            + self._paint(self.style.horizontal * count)
+            + self.title_right
+        )
 
-    def _repeat_with_string(self, c: str, s: str, n: int) -> str:
-        """Returns the title of the box with separators.
+        if self.title_position == TitlePosition.TOP:
+            return title_bar, bottom_bar
+        return top_bar, title_bar
 
-        This is only called when the title position is
-        TitlePosition.TOP or TitlePosition.BOTTOM
+    def padding(self, n: int) -> List[str]:
+        """Returns the vertical padding lines of a box.
 
         Arguments
         ---------
-        c : str
-            The separator
-        s : str
-            The title of the box
         n : int
             Computed width of the box.
 
         Returns
         -------
-        str
-            The title of the box with appended separators."""
+        list[str]
+            Lines equvivalent in number to the vertical padding,
+            with end separators.
+        """
+        return self._width_parts(n)[2]
 
-        count = n - wcswidth(s) - 2
-        if self.colour is not None:
-            bar = f"[{self.colour}]{c * count}[/{self.colour}]"
-        else:
-            bar = c * count
-        return f" {s} {bar}"
+    def row(self, item: str, length: int, longest_line: int) -> str:
+        """Returns a rendered line of the box.
 
-    def get_box(self, title: str, content: str) -> str:
-        """Returns a rendered box in the form of a string.
+        Arguments
+        ---------
+        item : str
+            The line to be rendered.
+        length : int
+            The width of the line.
+        longest_line : int
+            The width of the longest line in the box.
+
+        Returns
+        -------
+        str
+            The line aligned and enclosed in separators.
+        """
+        # Odd space is the space that needs to be added in a line if
+        # difference in the length of the current line and the longest
+        # line is odd. This fixes oddities in rendering.
+        space, odd_space = "", ""
+
+        # Calculate spacing and odd_space
+        if length < longest_line:
+            diff = longest_line - length
+            space = " " * (diff // 2)
+            if diff % 2 != 0:
+                odd_space = " "
+
+        # 'Render' the line using the format function.
+        return self.fmt.format(
+            sp=space + self.side_margin, ln=item, os=odd_space, s=space
+        )
+
+    def split(self, title: str, content: str) -> List[str]:
+        """Returns the lines inside the box, before they are laid out.
 
         Arguments
         ---------
@@ -268,9 +466,143 @@ class BoxFactory:
 
         Returns
         -------
+        list[str]
+            The lines of the title, if it is inside the box,
+            followed by the lines of the content.
+        """
+        lines = []
+
+        if self.inside:
+            lines.extend(title.splitlines())
+            lines.append("")
+
+        # This just splits the content in its constituent lines.
+        # and appends them to the lines list.
+        lines.extend(content.splitlines())
+        return lines
+
+    def iter_split(self, title: str, content: Iterable[str]) -> Iterator[str]:
+        """Yields the lines inside the box one at a time.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : Iterable[str]
+            The content of the box, or an iterable of its lines.
+
+        Yields
+        ------
         str
-            The rendered box with the title and content
-            provided by the user.
+            The lines of the title, if it is inside the box,
+            followed by the lines of the content.
+        """
+        if self.inside:
+            yield from title.splitlines()
+            yield ""
+
+        if isinstance(content, str):
+            content = _iter_lines(content)
+
+        yield from content
+
+    def measure(self, lines: List[str]) -> Tuple[List[str], List[int], int]:
+        """Measures the lines inside the box, wrapping those that don't fit.
+
+        Arguments
+        ---------
+        lines : list[str]
+            The lines inside the box, as returned by split.
+
+        Returns
+        -------
+        tuple[list[str], list[int], int]
+            The lines, wrapped if the box has a maximum width, their
+            widths and the width of the longest line.
+        """
+        widths, longest_line = measure_lines(lines, self.markup)
+
+        wrap_width = self.wrap_width
+        if not wrap_width or (
+            longest_line <= wrap_width and min(widths, default=0) >= 0
+        ):
+            return lines, widths, longest_line
+
+        # Only the lines that don't fit are wrapped, the pieces are
+        # measured as they are wrapped.
+        wrapped, wrapped_widths = [], []
+        for line, width in zip(lines, widths):
+            if width < 0 or width > wrap_width:
+                for piece, length in self._wrap(line, width):
+                    wrapped.append(piece)
+                    wrapped_widths.append(length)
+            else:
+                wrapped.append(line)
+                wrapped_widths.append(width)
+
+        return wrapped, wrapped_widths, max(max(wrapped_widths), 0)
+
+    def _wrap(self, line: str, width: int) -> List[Tuple[str, int]]:
+        """Wraps a line that may not fit in the box."""
+        pieces = wrap_line(line, self.wrap_width, self.markup)
+
+        # A line with control characters, such as tabs, has no width.
+        # It is wrapped as if they took up no cells, and left as it is
+        # if it fits then.
+        if width < 0 and len(pieces) == 1:
+            return [(line, width)]
+        return pieces
+
+    def iter_measure(self, lines: Iterable[str]) -> Iterator[Tuple[str, int]]:
+        """Yields the lines inside the box along with their widths.
+
+        Like measure, one line at a time.
+
+        Arguments
+        ---------
+        lines : Iterable[str]
+            The lines inside the box, as yielded by iter_split.
+
+        Yields
+        ------
+        tuple[str, int]
+            A line, wrapped if the box has a maximum width, and its width.
+        """
+        wrap_width = self.wrap_width
+        markup = self.markup
+
+        for line in lines:
+            width = line_width(line, markup)
+
+            if wrap_width and (width < 0 or width > wrap_width):
+                yield from self._wrap(line, width)
+            else:
+                yield line, width
+
+    def lines(
+        self,
+        title: str,
+        lines: Iterable[str],
+        widths: Iterable[int],
+        longest_line: int,
+    ) -> Iterator[str]:
+        """Yields the laid out lines of a box.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        lines : Iterable[str]
+            The lines inside the box, as returned by split.
+        widths : Iterable[int]
+            The widths of the lines.
+        longest_line : int
+            The width of the longest line.
+
+        Yields
+        ------
+        str
+            The lines of the box, without line terminators.
 
         Raises
         ------
@@ -280,22 +612,7 @@ class BoxFactory:
         TitleLengthError
             If the length of the title is larger than the
             length of the largest line in the content.
-        DifferentLengthError
-            If the length of the top bar is not equal to the
-            length of the bottom bar.
         """
-        # side_margin here refers to the horizontal padding.
-        side_margin = " " * self.Px
-
-        # compute the longest line
-        longest_line = _longest_line(content.splitlines())
-
-        if self.title_position == TitlePosition.INSIDE:
-            if wcswidth(title) > longest_line:
-                longest_line = wcswidth(title)
-
-        lines = []
-
         # n here is essentially the width of the rendered box
         # including the separators at the end.
         n = longest_line + (self.Px * 2) + 2
@@ -303,153 +620,1457 @@ class BoxFactory:
         # Check if the title is violating one of two things
         # 1) Title is outside the box and contains a new line.
         # 2) Title is longer than the length of the top and bottom bars.
-        if self.title_position != TitlePosition.INSIDE and "\n" in title:
+        if not self.inside and "\n" in title:
             raise TitlePositionError()
 
-        if self.title_position != TitlePosition.INSIDE and wcswidth(title) > n - 2:
-            raise TitleLengthError()
-
-        if self.title_position == TitlePosition.INSIDE:
-            lines.extend(title.splitlines())
-            lines.append("")
+        title_width = 0 if self.inside else line_width(title, self.markup)
 
-        # Create temporary top and bottom bars.
-        bar = self.style.horizontal * (n - 2)
-        top_bar = self.style.top_left + bar + self.style.top_right
-        bottom_bar = self.style.bottom_left + bar + self.style.bottom_right
+        if title_width > n - 2:
+            raise TitleLengthError()
 
-        if self.colour is not None:
-            top_bar = f"[{self.colour}]{top_bar}[/{self.colour}]"
+        top_bar, bottom_bar = self.bars(n, title, title_width)
+        padding = self.padding(n)
 
-            bottom_bar = f"[{self.colour}]{bottom_bar}[{self.colour}]"
+        yield top_bar
+        yield from padding
 
-        # Update the bars if the position of the title is other than
-        # that of inside the box.
-        if self.title_position != TitlePosition.INSIDE:
-            title_bar = self._repeat_with_string(self.style.horizontal, title, n - 2)
+        # This loop renders the title and the content.
+        row = self.row
+        empty = True
+        for item, length in zip(lines, widths):
+            yield row(item, length, longest_line)
+            empty = False
 
-            if self.title_position == TitlePosition.TOP:
-                if self.colour is not None:
-                    top_bar = (
-                        f"[{self.colour}]{self.style.top_left}[/{self.colour}]"
-                        + title_bar
-                        + f"[{self.colour}]{self.style.top_right}[/{self.colour}]"
-                    )
-                else:
-                    top_bar = self.style.top_left + title_bar + self.style.top_right
-
-            elif self.title_position == TitlePosition.BOTTOM:
-                if self.colour is not None:
-                    bottom_bar = (
-                        f"[{self.colour}]{self.style.bottom_left}[/{self.colour}]"
-                        + title_bar
-                        + f"[{self.colour}]{self.style.bottom_right}[/{self.colour}]"
-                    )
-                else:
-                    bottom_bar = (
-                        self.style.bottom_left + title_bar + self.style.bottom_right
-                    )
+        # An empty box still has an (unbordered) empty line.
+        if empty and not padding:
+            yield ""
 
-        # texts is a list that will eventually
-        # contain the rendered lines other than the top and bottom bars.
-        # Right now though it just contains the vertical padding lines.
-        texts = self._add_vert_padding(n)
+        # The padding here is added to maintain symmetry of the
+        # top and bottom halves of the box.
+        yield from padding
+        yield bottom_bar
 
-        # This just splits the content in its constituent lines.
-        # and appends them to the lines list.
-        lines.extend(content.splitlines())
+    def layout(self, title: str, content: str) -> str:
+        """Returns a laid out box, ready to be rendered by the engine.
 
-        # This loop renders the title and the content.
-        for item in lines:
-            length = wcswidth(item)
-
-            # Odd space is the space that needs to be added in a line if
-            # difference in the length of the current line and the longest
-            # line is odd. This fixes oddities in rendering.
-            space, odd_space = "", ""
-
-            # Calculate spacing and odd_space
-            if length < longest_line:
-                diff = longest_line - length
-                to_add = diff / 2
-                space = " " * int(to_add)
-                if diff % 2 != 0:
-                    odd_space = " "
-
-            # 'Render' the line using the format function.
-            if self.colour is not None:
-                sep = f"[{self.colour}]{self.style.vertical}[/{self.colour}]"
-            else:
-                sep = self.style.vertical
-            spacing = str(space) + str(side_margin)
-            fmt_string = alignments[self.alignment.value]
-            box_string = fmt_string.format(
-                sep=sep,
-                sp=spacing,
-                ln=item,
-                os=odd_space,
-                s=space,
-                px=side_margin,
-            )
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
 
-            # Add the line to our list of lines.
-            texts.append(box_string)
+        Returns
+        -------
+        str
+            The lines of the box, each terminated by a newline.
 
-        # The padding here is added to maintain symmetry of the
-        # top and bottom halves of the box.
-        vertpadding = self._add_vert_padding(n)
-        texts.extend(vertpadding)
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        # Measure every line exactly once, and compute the longest line.
+        lines, widths, longest_line = self.measure(self.split(title, content))
 
         # joint_lines is just the rendered lines joint by a new line
         # I just added this variable so I could comply with PEP8 :P
-        joint_lines = "\n".join(texts)
+        joint_lines = "\n".join(self.lines(title, lines, widths, longest_line))
+        return joint_lines + "\n"
 
-        # Finally after all that return the 'rendered' box.
-        with self.console.capture() as capture:
-            self.console.print(f"{top_bar}\n{joint_lines}\n{bottom_bar}\n")
+    def buffers(self, title: str, content: str, encoding: str) -> List[bytes]:
+        """Returns an encoded box, split in buffers for vectored writes.
 
-        return capture.get()
+        Only engines whose render terminates the box with a newline,
+        and leaves it as it is otherwise, are supported. The bars and
+        padding lines are the same for every box of a width, so they
+        are encoded once and memoized along with the other width
+        dependent parts, unless the title is a part of them.
 
-    def update(self, **kwargs) -> None:
-        """Update the settings of the box factory.
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+        encoding : str
+            The encoding of the buffers.
 
-        Keyword Arguments
-        -----------------
-        Px : int
-            The horizontal padding.
-        Py : int
-            The vertical padding.
-        style : Union[BoxStyles, RawStyle]
-            The style used to construct boxes
-        alignment : ContentAlignment
-            The alignment of the content and title.
-        title_pos : TitlePosition
-            The position of the title relative to the box.
-        colour : Union[ColourEnum, RGB]
-            The colour of the box border.
+        Returns
+        -------
+        list[bytes]
+            The top bar and padding, the content lines, and the
+            padding and bottom bar, together the same as the
+            encoded output of the engine.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
         """
-        if not kwargs:
-            return
+        lines, widths, longest_line = self.measure(self.split(title, content))
+        laid_out = list(self.lines(title, lines, widths, longest_line))
+
+        # Encodings that start with a BOM can't be encoded in parts.
+        if not _encodes_in_parts(encoding):
+            return [("\n".join(laid_out) + "\n\n").encode(encoding)]
+
+        # The bar and the padding lines at either end of the box.
+        edge = self.Py + 1
+        end = len(laid_out) - edge
+        body = "\n".join(laid_out[edge:end])
+
+        if self.inside:
+            n = longest_line + (self.Px * 2) + 2
+            head, tail = self._encoded_parts(
+                n, encoding, laid_out[:edge], laid_out[end:]
+            )
+        else:
+            head = ("\n".join(laid_out[:edge]) + "\n").encode(encoding)
+            tail = ("\n".join(laid_out[end:]) + "\n\n").encode(encoding)
+
+        if end == edge:
+            return [head, tail]
+        return [head, (body + "\n").encode(encoding), tail]
+
+    def _encoded_parts(
+        self, n: int, encoding: str, head: List[str], tail: List[str]
+    ) -> Tuple[bytes, bytes]:
+        """Returns the encoded ends of a box, memoized by width and encoding."""
+        parts = self._encoded.get((n, encoding))
+
+        if parts is None:
+            if len(self._encoded) >= self.max_widths:
+                self._encoded.clear()
+
+            parts = (
+                ("\n".join(head) + "\n").encode(encoding),
+                ("\n".join(tail) + "\n\n").encode(encoding),
+            )
+            self._encoded[(n, encoding)] = parts
+
+        return parts
+
+    def grid(
+        self,
+        items: List[Tuple[str, str]],
+        columns: Optional[int],
+        gap: int,
+        row_gap: int,
+        max_width: int,
+    ) -> str:
+        """Returns boxes laid out in a grid, ready to be rendered by the engine.
+
+        The boxes of a column are as wide as its widest box, and the
+        boxes of a row are as tall as its tallest box, so the lines of
+        the boxes of a row can be joined side by side as they are laid
+        out, without measuring them again. Markup still open at the end
+        of a line of a box is closed, and opened again on the next line
+        of the box, so it can't leak into the boxes next to it.
 
-        self.Px = kwargs.get("Px", self.Px)
-        self.Py = kwargs.get("Py", self.Py)
+        Arguments
+        ---------
+        items : List[Tuple[str, str]]
+            The (title, content) pairs of the boxes, row by row.
+        columns : Optional[int]
+            The amount of boxes in a row, or None for as many
+            as fit in the maximum width.
+        gap : int
+            The amount of spaces between the boxes of a row.
+        row_gap : int
+            The amount of empty lines between the rows.
+        max_width : int
+            The width the rows should fit in when the amount
+            of columns is not given.
 
-        style_temp = kwargs.get("style", self.style)
+        Returns
+        -------
+        str
+            The lines of the grid, each terminated by a newline.
 
-        if isinstance(style_temp, BoxStyles):
-            self.style = default_styles.get(style_temp.value)
-        else:
-            self.style = style_temp
+        Raises
+        ------
+        ValueError
+            If the amount of columns is less than one, or
+            a gap is negative.
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        if columns is not None and columns < 1:
+            raise ValueError("A grid needs at least one column.")
+        if gap < 0 or row_gap < 0:
+            raise ValueError("The gaps of a grid can't be negative.")
 
-        self.alignment = kwargs.get("alignment", self.alignment)
-        self.title_position = kwargs.get("title_pos", self.title_position)
+        # Split and measure every box exactly once.
+        boxes = []
+        for title, content in items:
+            lines, widths, longest_line = self.measure(self.split(title, content))
 
-        if "colour" in kwargs:
-            colour = kwargs["colour"]
+            if not self.inside:
+                title_width = line_width(title, self.markup)
+                if title_width > longest_line + (self.Px * 2):
+                    raise TitleLengthError()
 
-            if isinstance(colour, ColourEnum):
-                self.colour = colours_list.get(colour.value)
-            elif isinstance(colour, RGB):
-                self.colour = colour.rgb
-            else:
-                self.colour = colours_list.get(ColourEnum.WHITE.value)
+                # A title bar is never narrower than the title and two
+                # corners, widen the box so its lines are as wide too.
+                longest_line = max(longest_line, title_width + 2 - (self.Px * 2))
+
+            boxes.append((title, lines, widths, longest_line))
+
+        if columns is None:
+            columns = self._grid_columns([box[3] for box in boxes], gap, max_width)
+
+        # A row can't have more columns than there are boxes.
+        columns = min(columns, len(boxes))
+
+        longest_lines = [
+            max(box[3] for box in boxes[column::columns]) for column in range(columns)
+        ]
+
+        sep = " " * gap
+        grid = []
+
+        for start in range(0, len(boxes), columns):
+            if grid:
+                grid.extend([""] * row_gap)
+
+            end = start + columns
+            row = boxes[start:end]
+            height = max(len(lines) for _, lines, _, _ in row)
+
+            # Without padding an empty box has an unbordered line, which
+            # can't be joined with the other boxes, so give it a row.
+            if height == 0 and not self.Py:
+                height = 1
+
+            laid_out = []
+            for (title, lines, widths, _), longest_line in zip(row, longest_lines):
+                blank = height - len(lines)
+                box = self.lines(
+                    title,
+                    itertools.chain(lines, [""] * blank),
+                    itertools.chain(widths, [0] * blank),
+                    longest_line,
+                )
+                laid_out.append(self._isolate(box) if self.markup else box)
+
+            grid.extend(map(sep.join, zip(*laid_out)))
+
+        return "\n".join(grid) + "\n"
+
+    def _isolate(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yields the laid out lines of a box with the markup tags still
+        open at the end of every line closed, and opened again after the
+        first border of the next line, which keeps its colour."""
+        # The tag that closes the colour of the border, if it has one.
+        painted = self._paint("")
+        close = painted.partition("]")[2]
+
+        tags: List[Tuple[str, str]] = []
+        for line in lines:
+            opened = tags
+            tags = _open_tags(line, opened)
+
+            if opened:
+                index = line.find(close) + len(close) if close else 0
+                tags_markup = "".join(markup for _, markup in opened)
+                line = line[:index] + tags_markup + line[index:]
+
+            yield line + "[/]" * len(tags)
+
+    def _grid_columns(self, longest_lines: List[int], gap: int, max_width: int) -> int:
+        """Returns the largest amount of columns whose rows fit in a width."""
+        border = (self.Px * 2) + 2
+
+        for columns in range(len(longest_lines), 1, -1):
+            width = gap * (columns - 1)
+            for column in range(columns):
+                width += max(longest_lines[column::columns]) + border
+
+            if width <= max_width:
+                return columns
+
+        return 1
+
+    def stream(self, title: str, lines: Iterable[str], width: int) -> Iterator[str]:
+        """Yields the laid out lines of a box as the content lines arrive.
+
+        Lines wider than the width are word wrapped, like they are by
+        measure.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        lines : Iterable[str]
+            The lines of the content of the box.
+        width : int
+            The width of the content of the box.
+
+        Yields
+        ------
+        str
+            The lines of the box, without line terminators.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            width of the box.
+        """
+        title_width = line_width(title, self.markup)
+        n = width + (self.Px * 2) + 2
+
+        if not self.inside and "\n" in title:
+            raise TitlePositionError()
+
+        if not self.inside and title_width > n - 2:
+            raise TitleLengthError()
+
+        top_bar, bottom_bar = self.bars(n, title, title_width)
+        padding = self.padding(n)
+        row = self.row
+
+        yield top_bar
+        yield from padding
+
+        if self.inside:
+            for item in title.splitlines():
+                for piece, length in wrap_line(item, width, self.markup):
+                    yield row(piece, length, width)
+            yield row("", 0, width)
+
+        for line in lines:
+            # Lines read from files and pipes keep their terminators.
+            for item in line.splitlines() or [""]:
+                for piece, length in wrap_line(item, width, self.markup):
+                    yield row(piece, length, width)
+
+        yield from padding
+        yield bottom_bar
+
+
+class BoxFactory:
+    """Represents a Box factory.
+
+    This class can be used to create terminal boxes with ease.
+
+    The settings of the factory are compiled into a reusable
+    template when the first box is rendered, and again after they
+    are updated. A template is never modified once it is compiled,
+    so a factory can be shared by several threads: every render
+    works with the template that was current when it started.
+
+    Arguments
+    ---------
+    Px : int
+        Horizontal padding.
+    Py : int
+        Vertical padding.
+    style : Union[BoxStyles, RawStyle]
+        The style used to construct boxes.
+        You can pass in a BoxStyles enum for builtin styles.
+        or use boxcli.RawStyle to specify a custom one.
+
+    Keyword Arguments
+    -----------------
+    alignment : ContentAlignment
+        The alignment used to construct boxes.
+        Defaults to ContentAlignment.CENTRE
+    title_pos : TitlePosition
+        The position of the title with respect to the box.
+        Defaults to TitlePosition.INSIDE
+    colour : Union[ColourEnum, RGB]
+        The colour to be used to construct the box border.
+        Defaults to white colour.
+    engine : RenderEngine
+        The engine used to render boxes.
+        Defaults to RenderEngine.RICH
+    console : rich.console.Console
+        The console used to render boxes.
+        Defaults to the console shared by every factory writing
+        to the same file.
+    file : IO[str]
+        The file the shared console writes to, when no console
+        is passed.
+        Defaults to sys.stdout
+    max_width : Optional[int]
+        The maximum width of a box, including its border. Content
+        lines that don't fit are word wrapped, 0 turns wrapping off.
+        Defaults to None, the width of the terminal, which is looked
+        up again at most every width_interval seconds so boxes follow
+        the terminal when it is resized. Builders and viewports keep
+        the width of the terminal when they were created.
+    """
+
+    # Looking the width of the terminal up is a system call, so it is
+    # looked up again at most this often, in seconds.
+    width_interval = 0.25
+
+    def __init__(self, Px: int, Py: int, style: Union[BoxStyles, RawStyle], **kwargs):
+        """The constructor nothing to explain here."""
+        # Guards updates of the settings and compilation of the template,
+        # rendering never takes it once the template is compiled.
+        self._lock = threading.RLock()
+
+        self.Px = Px
+        self.Py = Py
+
+        if isinstance(style, BoxStyles):
+            self.style = default_styles.get(style.value)
+        else:
+            self.style = style
+
+        self.alignment = kwargs.get("alignment", ContentAlignment.CENTRE)
+        self.title_position = kwargs.get("title_pos", TitlePosition.INSIDE)
+
+        colour = kwargs.get("colour", ColourEnum.WHITE)
+
+        if isinstance(colour, ColourEnum):
+            self.colour = colours_list.get(colour.value)
+        elif isinstance(colour, RGB):
+            self.colour = colour.rgb
+        else:
+            self.colour = colours_list.get(ColourEnum.WHITE.value)
+
+        self.engine = kwargs.get("engine", RenderEngine.RICH)
+        self.max_width: Optional[int] = kwargs.get("max_width")
+
+        # When the width of the terminal is looked up again.
+        self._next_width_check = 0.0
+
+        # Statistics are only collected, and boxes only cached,
+        # once they are enabled.
+        self.stats: Optional[RenderStats] = None
+        self.cache: Optional[RenderCache] = None
+
+        self.file: Optional[IO[str]] = kwargs.get("file")
+        self.console = kwargs.get("console")
+
+    @property
+    def console(self) -> "Console":
+        """The rich console used to render boxes.
+
+        Unless a console was passed to the factory, the console shared
+        by every factory writing to the same file is used, and it is
+        only looked up the first time it is needed. Assigning a new
+        console recompiles the template of the factory."""
+        if self._console is None:
+            with self._lock:
+                if self._console is None:
+                    self._console = get_console(self.file)
+        return self._console
+
+    @console.setter
+    def console(self, console: Optional["Console"]) -> None:
+        with self._lock:
+            self._console = console
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drops the template, and the boxes rendered with it."""
+        self._template = None
+
+        cache = self.cache
+        if cache is not None:
+            cache.clear()
+
+    def _terminal_width(self) -> int:
+        """Returns the width of the terminal boxes are rendered for."""
+        if self.engine == RenderEngine.PLAIN and self._console is None:
+            import shutil
+
+            return shutil.get_terminal_size().columns
+        return self.console.width
+
+    def _settings(self) -> tuple:
+        """Returns the settings the template is compiled from."""
+        return (
+            self.Px,
+            self.Py,
+            self.style,
+            self.alignment,
+            self.title_position,
+            self.colour,
+            self.engine,
+            self.max_width,
+        )
+
+    def _compile(self) -> BoxTemplate:
+        """Compiles the settings of the factory into a template."""
+        with self._lock:
+            # The plain engine doesn't need a console, don't create one.
+            if self.engine == RenderEngine.PLAIN:
+                console = self._console
+            else:
+                console = self.console
+
+            engine = render_engines[self.engine.value](console, self.colour)
+
+            max_width = self.max_width
+            if max_width is None:
+                max_width = self._terminal_width()
+                self._next_width_check = time.monotonic() + self.width_interval
+
+            self._template = BoxTemplate(
+                self.Px,
+                self.Py,
+                self.style,
+                self.alignment,
+                self.title_position,
+                engine,
+                max_width,
+            )
+            return self._template
+
+    def _resized(self, template: BoxTemplate, now: float) -> bool:
+        """Returns whether the terminal was resized since the template
+        was compiled for its width."""
+        self._next_width_check = now + self.width_interval
+        return self.max_width is None and template.max_width != self._terminal_width()
+
+    def _get_template(self) -> BoxTemplate:
+        """Returns the template of the factory, compiling it if needed."""
+        template = self._template
+
+        # Most renders only compare the time with the next check.
+        now = time.monotonic()
+        if template is None or (
+            now >= self._next_width_check and self._resized(template, now)
+        ):
+            with self._lock:
+                # Another thread may have compiled it in the meantime.
+                current = self._template
+                if current is not None and current is not template:
+                    return current
+                if current is not None:
+                    self._invalidate()
+                return self._compile()
+        return template
+
+    def enable_stats(
+        self, callback: Optional[Callable[[dict], None]] = None
+    ) -> RenderStats:
+        """Starts collecting statistics of the rendered boxes.
+
+        Boxes rendered with get_box, get_boxes and iter_boxes are timed
+        phase by phase, and counted. Boxes rendered any other way are
+        not, see RenderStats. Until statistics are enabled the only
+        cost to rendering is checking whether they are.
+
+        Arguments
+        ---------
+        callback : Optional[Callable[[dict], None]]
+            Called after every render with the statistics of that render.
+
+        Returns
+        -------
+        RenderStats
+            The statistics, also available as the stats attribute.
+        """
+        stats = RenderStats(callback)
+        self.stats = stats
+        return stats
+
+    def disable_stats(self) -> None:
+        """Stops collecting statistics of the rendered boxes."""
+        self.stats = None
+
+    def enable_cache(
+        self, max_entries: int = 1024, max_bytes: int = 1 << 22
+    ) -> RenderCache:
+        """Starts caching the rendered boxes.
+
+        Boxes rendered with get_box, get_boxes and iter_boxes are cached
+        by their title, content and the settings of the factory. The
+        cache is emptied when the settings or the console are changed.
+
+        Arguments
+        ---------
+        max_entries : int
+            The maximum amount of cached boxes.
+            Defaults to 1024
+        max_bytes : int
+            The maximum memory taken up by the cached boxes, in bytes.
+            Defaults to 4 MiB
+
+        Returns
+        -------
+        RenderCache
+            The cache, also available as the cache attribute.
+        """
+        cache = RenderCache(max_entries, max_bytes)
+        self.cache = cache
+        return cache
+
+    def disable_cache(self) -> None:
+        """Stops caching the rendered boxes, and drops the cached ones."""
+        self.cache = None
+
+    def _render_boxes(
+        self, template: BoxTemplate, pairs: Iterable[Tuple[str, str]]
+    ) -> List[str]:
+        """Renders boxes in a single pass through the render engine."""
+        # Statistics can be disabled by another thread during the render.
+        stats = self.stats
+        if stats is not None:
+            return self._profiled_boxes(template, pairs, stats)
+
+        layout = template.layout
+        return template.engine.render_many(
+            [layout(title, content) for title, content in pairs]
+        )
+
+    def _cached_boxes(
+        self,
+        template: BoxTemplate,
+        pairs: Iterable[Tuple[str, str]],
+        cache: RenderCache,
+    ) -> List[str]:
+        """Renders boxes that aren't cached yet, and caches them."""
+        boxes = []
+        missed = []
+
+        for title, content in pairs:
+            # The template stands in for the settings it was compiled
+            # from, so a render that started before an update can't
+            # cache a box under the new settings.
+            key = (title, content, template)
+            box = cache.get(key)
+
+            if box is None:
+                missed.append((len(boxes), key))
+            boxes.append(box)
+
+        if missed:
+            rendered = self._render_boxes(template, [key[:2] for _, key in missed])
+
+            for (i, key), box in zip(missed, rendered):
+                boxes[i] = box
+                cache.put(key, box)
+
+        return boxes
+
+    def _profiled_boxes(
+        self,
+        template: BoxTemplate,
+        pairs: Iterable[Tuple[str, str]],
+        stats: RenderStats,
+    ) -> List[str]:
+        """Renders boxes like get_boxes does, recording their statistics."""
+        measure = layout = 0.0
+        texts = []
+
+        for title, content in pairs:
+            start = time.perf_counter()
+            lines, widths, longest_line = template.measure(
+                template.split(title, content)
+            )
+            measured = time.perf_counter()
+
+            rows = template.lines(title, lines, widths, longest_line)
+            texts.append("\n".join(rows) + "\n")
+            laid_out = time.perf_counter()
+
+            measure += measured - start
+            layout += laid_out - measured
+
+        start = time.perf_counter()
+        boxes = template.engine.render_many(texts)
+        render = time.perf_counter() - start
+
+        stats.record(
+            len(boxes),
+            sum(text.count("\n") for text in texts),
+            sum(len(box.encode("utf-8")) for box in boxes),
+            measure,
+            layout,
+            render,
+        )
+        return boxes
+
+    def get_box(self, title: str, content: str) -> str:
+        """Returns a rendered box in the form of a string.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+
+        Returns
+        -------
+        str
+            The rendered box with the title and content
+            provided by the user.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        template = self._get_template()
+
+        # The cache can be disabled by another thread during the render.
+        cache = self.cache
+        if cache is not None:
+            return self._cached_boxes(template, [(title, content)], cache)[0]
+
+        stats = self.stats
+        if stats is not None:
+            return self._profiled_boxes(template, [(title, content)], stats)[0]
+
+        # Finally after all that return the 'rendered' box.
+        return template.engine.render(template.layout(title, content))
+
+    def get_box_buffers(
+        self, title: str, content: str, encoding: str = "utf-8"
+    ) -> List[bytes]:
+        """Returns a rendered box as encoded buffers.
+
+        The buffers can be written with a single vectored write, such
+        as ``os.writev``, or joined together. With the ANSI and plain
+        engines the bars of a box are encoded once for every width,
+        and only the content lines are encoded for every box. With the
+        rich engine the whole rendered box is a single buffer.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+        encoding : str
+            The encoding of the buffers.
+            Defaults to utf-8
+
+        Returns
+        -------
+        list[bytes]
+            The buffers, together the same as the encoded
+            output of get_box.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        template = self._get_template()
+
+        if not template.engine.passthrough:
+            return [self.get_box(title, content).encode(encoding)]
+
+        return template.buffers(title, content, encoding)
+
+    def get_box_bytes(self, title: str, content: str, encoding: str = "utf-8") -> bytes:
+        """Returns a rendered box, encoded.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+        encoding : str
+            The encoding of the box.
+            Defaults to utf-8
+
+        Returns
+        -------
+        bytes
+            The same as the encoded output of get_box.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        return b"".join(self.get_box_buffers(title, content, encoding))
+
+    def get_renderable(self, title: str, content: str) -> "BoxRenderable":
+        """Returns a box that rich renders natively.
+
+        The box can be printed by a rich console, or embedded in rich
+        layouts, tables and live displays, in a single render pass.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+
+        Returns
+        -------
+        BoxRenderable
+            The box, laid out with the settings of the factory.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        from .renderable import BoxRenderable
+
+        return BoxRenderable(self._get_template(), title, content)
+
+    def get_builder(self, title: str = "") -> "BoxBuilder":
+        """Returns a box that lines can be appended to, one at a time.
+
+        Appending a line only lays out that line, unless it is wider
+        than every line before it, so a box built up line by line
+        isn't laid out again for every line. The builder keeps the
+        settings the factory had when it was created.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+
+        Returns
+        -------
+        BoxBuilder
+            The builder, whose render method renders the box.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        """
+        from .builder import BoxBuilder
+
+        return BoxBuilder(self._get_template(), title)
+
+    def get_viewport(self, title: str, content: str) -> "BoxViewport":
+        """Returns a box of which a window of lines is rendered at a time.
+
+        The content is split and measured once, so rendering a window
+        of a huge box, for a pager, only costs as much as the window.
+        The viewport keeps the settings the factory had when it was
+        created.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+
+        Returns
+        -------
+        BoxViewport
+            The viewport, whose render method renders a window.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        from .viewport import BoxViewport
+
+        return BoxViewport(self._get_template(), title, content)
+
+    def get_grid(
+        self,
+        items: Iterable[Tuple[str, str]],
+        columns: Optional[int] = None,
+        gap: int = 2,
+        row_gap: int = 1,
+    ) -> str:
+        """Returns boxes laid out side by side in a grid.
+
+        The boxes are filled in row by row. Every box in a column is as
+        wide as the widest one, and every box in a row is as tall as
+        the tallest one. The grid is laid out with the style and colour
+        of the factory and rendered in a single pass.
+
+        Arguments
+        ---------
+        items : Iterable[Tuple[str, str]]
+            The (title, content) pairs of the boxes.
+        columns : Optional[int]
+            The amount of boxes in a row. Defaults to as many
+            as fit in the width of the console.
+        gap : int
+            The amount of spaces between the boxes of a row.
+            Defaults to 2
+        row_gap : int
+            The amount of empty lines between the rows.
+            Defaults to 1
+
+        Returns
+        -------
+        str
+            The rendered grid.
+
+        Raises
+        ------
+        ValueError
+            If the amount of columns is less than one, or
+            a gap is negative.
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        items = list(items)
+        if not items:
+            return ""
+
+        template = self._get_template()
+
+        # The console is only needed to find out how many columns fit.
+        max_width = self._terminal_width() if columns is None else 0
+        layout = template.grid(items, columns, gap, row_gap, max_width)
+
+        return template.engine.render(layout)
+
+    def get_boxes(self, pairs: Iterable[Tuple[str, str]]) -> List[str]:
+        """Returns a list of rendered boxes.
+
+        The boxes are laid out with the same template and rendered
+        in a single pass through the render engine, which is much
+        faster than calling get_box for every box.
+
+        Arguments
+        ---------
+        pairs : Iterable[Tuple[str, str]]
+            The (title, content) pairs of the boxes.
+
+        Returns
+        -------
+        list[str]
+            The rendered boxes, in the same order as the pairs.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet a title contains a newline.
+        TitleLengthError
+            If the length of a title is larger than the
+            length of the largest line in its content.
+        """
+        template = self._get_template()
+
+        cache = self.cache
+        if cache is not None:
+            return self._cached_boxes(template, pairs, cache)
+
+        return self._render_boxes(template, pairs)
+
+    def iter_boxes(
+        self, pairs: Iterable[Tuple[str, str]], chunk_size: int = 1000
+    ) -> Iterator[str]:
+        """Yields rendered boxes.
+
+        The pairs are consumed lazily and rendered in chunks,
+        each chunk making a single pass through the render engine.
+
+        Arguments
+        ---------
+        pairs : Iterable[Tuple[str, str]]
+            The (title, content) pairs of the boxes.
+        chunk_size : int
+            The amount of boxes rendered at a time.
+            Defaults to 1000
+
+        Yields
+        ------
+        str
+            The rendered boxes, in the same order as the pairs.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet a title contains a newline.
+        TitleLengthError
+            If the length of a title is larger than the
+            length of the largest line in its content.
+        """
+        pairs = iter(pairs)
+
+        while True:
+            chunk = list(itertools.islice(pairs, chunk_size))
+            if not chunk:
+                return
+
+            yield from self.get_boxes(chunk)
+
+    async def write_box_async(
+        self,
+        writer: "asyncio.StreamWriter",
+        title: str,
+        content: str,
+        chunk_size: int = 100,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Writes a rendered box to an asyncio stream writer.
+
+        The box is measured and rendered in chunks of lines, and every
+        chunk is written as soon as it is rendered. The writer is
+        drained after every chunk, and control is given back to the
+        event loop between chunks, so even a box with hundreds of
+        thousands of lines doesn't stall other tasks. The bytes written
+        are the same as the encoded output of get_box.
+
+        Arguments
+        ---------
+        writer : asyncio.StreamWriter
+            The writer the box is written to.
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+        chunk_size : int
+            The amount of lines rendered and written at a time.
+            Defaults to 100
+        encoding : str
+            The encoding of the written box.
+            Defaults to utf-8
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        import asyncio
+
+        template = self._get_template()
+        lines = template.split(title, content)
+
+        # Measuring can take a while for a lot of non-ASCII lines.
+        measured: List[str] = []
+        widths: List[int] = []
+        for start in range(0, len(lines), chunk_size):
+            end = start + chunk_size
+            chunk, chunk_widths, _ = template.measure(lines[start:end])
+            measured.extend(chunk)
+            widths.extend(chunk_widths)
+            await asyncio.sleep(0)
+
+        lines = measured
+        longest_line = max(max(widths, default=0), 0)
+        rows = template.lines(title, lines, widths, longest_line)
+
+        # Encode the chunks as one text, so a BOM is only written once.
+        encode = codecs.getincrementalencoder(encoding)().encode
+
+        # Markup still open at the end of a chunk is carried over
+        # into the next one.
+        for text in template.engine.render_chunks(_chunks(rows, chunk_size)):
+            writer.write(encode(text))
+            await writer.drain()
+
+            # drain() only waits when the buffer is full.
+            await asyncio.sleep(0)
+
+        # The same trailing newline get_box ends with.
+        writer.write(encode("\n"))
+        await writer.drain()
+
+    def render_to(
+        self,
+        fp: IO,
+        title: str,
+        content: str,
+        chunk_size: int = 100,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Writes a rendered box to a text or binary stream.
+
+        The box is rendered and written a chunk of lines at a time with
+        writelines, instead of being built as one string. The lines of
+        the content are read from it one at a time, once to find the
+        longest line and once to render them, so the memory used stays
+        proportional to a chunk of lines no matter how big the box is.
+        What is written is the same as the output of get_box.
+
+        Arguments
+        ---------
+        fp : IO
+            The stream the box is written to, for example a file
+            or a socket file. Binary streams are written the
+            encoded box.
+        title : str
+            The title of the box.
+        content : str
+            The content of the box.
+        chunk_size : int
+            The amount of lines rendered and written at a time.
+            Defaults to 100
+        encoding : str
+            The encoding used for binary streams.
+            Defaults to utf-8
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        template = self._get_template()
+        self._write_box(
+            fp,
+            template,
+            title,
+            lambda: template.iter_split(title, content),
+            chunk_size,
+            encoding,
+        )
+
+    def render_file(
+        self,
+        fp: IO,
+        title: str,
+        path: Union[str, os.PathLike],
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        chunk_size: int = 100,
+        output_encoding: str = "utf-8",
+    ) -> None:
+        """Writes a box around the contents of a file to a stream.
+
+        The file is memory mapped and read twice, a block of lines at a
+        time: once to find the longest line and once to render the box.
+        The decoded file and the list of its lines are never held in
+        memory, so files of any size can be boxed. The box is written
+        like render_to does it, and is the same as the output of
+        get_box for the decoded contents of the file.
+
+        Arguments
+        ---------
+        fp : IO
+            The stream the box is written to.
+        title : str
+            The title of the box.
+        path : Union[str, os.PathLike]
+            The path of the file.
+        encoding : str
+            The encoding of the file. It must encode a newline
+            as the single byte ``\\n``, like UTF-8 and the other
+            ASCII compatible encodings do.
+            Defaults to utf-8
+        errors : str
+            How decoding errors are handled, as in bytes.decode.
+            Defaults to strict
+        chunk_size : int
+            The amount of lines rendered and written at a time.
+            Defaults to 100
+        output_encoding : str
+            The encoding used for binary streams.
+            Defaults to utf-8
+
+        Raises
+        ------
+        ValueError
+            If the encoding doesn't encode a newline as a single byte.
+        UnicodeDecodeError
+            If the file can't be decoded and errors is strict.
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the file.
+        """
+        import mmap
+
+        # The file is split on newline bytes before it is decoded. Encode
+        # the newline after a character, so a BOM isn't a part of it.
+        prefix = codecs.encode("a", encoding)
+        if codecs.encode("a\n", encoding) != prefix + b"\n":
+            raise ValueError(f"Unsupported file encoding: {encoding}")
+
+        template = self._get_template()
+
+        with open(path, "rb") as f:
+            # Empty files can't be memory mapped.
+            if os.fstat(f.fileno()).st_size == 0:
+                self.render_to(fp, title, "", chunk_size, output_encoding)
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+
+                def lines() -> Iterator[str]:
+                    decoder = codecs.getincrementaldecoder(encoding)(errors)
+                    size = len(mapped)
+                    start = 0
+
+                    # Decode blocks of about a megabyte that end on a newline,
+                    # so only one block is held in memory at a time.
+                    while start < size:
+                        end = mapped.find(b"\n", start + (1 << 20))
+                        end = size if end == -1 else end + 1
+
+                        yield from decoder.decode(mapped[start:end]).splitlines()
+                        start = end
+
+                    yield from decoder.decode(b"", final=True).splitlines()
+
+                self._write_box(
+                    fp,
+                    template,
+                    title,
+                    lambda: template.iter_split(title, lines()),
+                    chunk_size,
+                    output_encoding,
+                )
+
+    def _write_box(
+        self,
+        fp: IO,
+        template: BoxTemplate,
+        title: str,
+        lines: Callable[[], Iterator[str]],
+        chunk_size: int,
+        encoding: str,
+    ) -> None:
+        """Writes a rendered box to a stream, a chunk of lines at a time.
+
+        Arguments
+        ---------
+        fp : IO
+            The stream the box is written to.
+        template : BoxTemplate
+            The template used to render the box.
+        title : str
+            The title of the box.
+        lines : Callable[[], Iterator[str]]
+            Returns a new iterator of the lines inside the box, it
+            is called twice.
+        chunk_size : int
+            The amount of lines rendered and written at a time.
+        encoding : str
+            The encoding used for binary streams.
+        """
+        widths = (width for _, width in template.iter_measure(lines()))
+        longest_line = max(max(widths, default=0), 0)
+
+        # The lines are read in lockstep, so tee only holds one of them.
+        items, measured = itertools.tee(template.iter_measure(lines()))
+        rows = template.lines(
+            title,
+            (line for line, _ in items),
+            (width for _, width in measured),
+            longest_line,
+        )
+
+        # Every chunk is rendered as one text, and markup still open at
+        # the end of a chunk is carried over into the next one. The same
+        # trailing newline get_box ends with follows the last chunk.
+        texts = itertools.chain(
+            template.engine.render_chunks(_chunks(rows, chunk_size)), ["\n"]
+        )
+
+        # Encode the chunks as one text, so a BOM is only written once.
+        if _is_binary(fp):
+            texts = map(codecs.getincrementalencoder(encoding)().encode, texts)
+
+        fp.writelines(texts)
+
+    def get_boxes_parallel(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[str]:
+        """Returns a list of boxes rendered by a pool of worker processes.
+
+        The settings of the factory, along with the colour system and
+        width of its console, are sent to every worker process once.
+        The pairs are split into chunks that are rendered with
+        get_boxes, so the boxes are the same as those returned by
+        get_box.
+
+        Arguments
+        ---------
+        pairs : Iterable[Tuple[str, str]]
+            The (title, content) pairs of the boxes.
+        processes : Optional[int]
+            The amount of worker processes.
+            Defaults to the amount of CPUs.
+        chunk_size : int
+            The amount of boxes sent to a worker process at a time.
+            Defaults to 1000
+
+        Returns
+        -------
+        list[str]
+            The rendered boxes, in the same order as the pairs.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet a title contains a newline.
+        TitleLengthError
+            If the length of a title is larger than the
+            length of the largest line in its content.
+        """
+        from .parallel import render_parallel
+
+        return list(render_parallel(self, pairs, processes, chunk_size))
+
+    def stream(
+        self, title: str, lines: Iterable[str], width: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yields the rendered lines of a box as the content lines arrive.
+
+        The top bar is yielded right away, every content line as soon
+        as it is read and the bottom bar once the lines run out, so
+        content of any length can be boxed with constant memory.
+        Lines wider than the width of the box are word wrapped, like
+        they are by get_box. Markup can span several lines, like it
+        can with get_box.
+
+        Arguments
+        ---------
+        title : str
+            The title of the box.
+        lines : Iterable[str]
+            The lines of the content of the box, for example a file
+            or the stdout of a subprocess.
+        width : Optional[int]
+            The width of the content of the box. Defaults to the
+            widest content that fits in the maximum width of the
+            factory, or in the console if it has none.
+
+        Yields
+        ------
+        str
+            The rendered lines of the box, each terminated
+            by a newline.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            width of the box.
+        """
+        template = self._get_template()
+
+        if width is None:
+            width = template.wrap_width or max(
+                self._terminal_width() - (template.Px * 2) - 2, 1
+            )
+
+        # Every line is rendered as soon as it is laid out, and markup
+        # still open at the end of a line is carried over into the next.
+        yield from template.engine.render_chunks(template.stream(title, lines, width))
+
+    def update(self, **kwargs) -> None:
+        """Update the settings of the box factory.
+
+        The template of the factory is recompiled with the new settings
+        when the next box is rendered, unless none of them changed.
+
+        Keyword Arguments
+        -----------------
+        Px : int
+            The horizontal padding.
+        Py : int
+            The vertical padding.
+        style : Union[BoxStyles, RawStyle]
+            The style used to construct boxes
+        alignment : ContentAlignment
+            The alignment of the content and title.
+        title_pos : TitlePosition
+            The position of the title relative to the box.
+        colour : Union[ColourEnum, RGB]
+            The colour of the box border.
+        engine : RenderEngine
+            The engine used to render boxes.
+        max_width : Optional[int]
+            The maximum width of a box, None for the width of
+            the terminal and 0 for no maximum.
+        """
+        if not kwargs:
+            return
+
+        # Renders that already started keep using the old template, and
+        # no template can be compiled from half updated settings.
+        with self._lock:
+            settings = self._settings()
+
+            self.Px = kwargs.get("Px", self.Px)
+            self.Py = kwargs.get("Py", self.Py)
+
+            style_temp = kwargs.get("style", self.style)
+
+            if isinstance(style_temp, BoxStyles):
+                self.style = default_styles.get(style_temp.value)
+            else:
+                self.style = style_temp
+
+            self.alignment = kwargs.get("alignment", self.alignment)
+            self.title_position = kwargs.get("title_pos", self.title_position)
+
+            if "colour" in kwargs:
+                colour = kwargs["colour"]
+
+                if isinstance(colour, ColourEnum):
+                    self.colour = colours_list.get(colour.value)
+                elif isinstance(colour, RGB):
+                    self.colour = colour.rgb
+                else:
+                    self.colour = colours_list.get(ColourEnum.WHITE.value)
+
+            self.engine = kwargs.get("engine", self.engine)
+            self.max_width = kwargs.get("max_width", self.max_width)
+
+            # Styles and colours compare by value, so updating a factory
+            # with the settings it already has keeps its template.
+            if self._settings() != settings:
+                # The template is recompiled the next time a box is rendered.
+                self._invalidate()
@@ -0,0 +1,123 @@
+import itertools
+from typing import Iterable, List
+
+from .box import BoxTemplate
+from .errors import TitleLengthError, TitlePositionError
+from .width import line_width
+
+__all__ = ["BoxBuilder"]
+
+
+class BoxBuilder:
+    """A box that lines are appended to, one at a time.
+
+    Every appended line is measured once, and laid out as soon as it
+    is appended. The laid out lines are kept, so appending a line that
+    isn't wider than the widest line so far only lays out that line.
+    When a wider line is appended, the lines kept are aligned again
+    with the widths they were measured with, without measuring them
+    again.
+
+    Arguments
+    ---------
+    template : BoxTemplate
+        The template of the factory that created the builder.
+    title : str
+        The title of the box.
+
+    Raises
+    ------
+    TitlePositionError
+        If the position of the title is not TitlePosition.INSIDE
+        and yet it contains a newline.
+    """
+
+    def __init__(self, template: BoxTemplate, title: str = "") -> None:
+        if not template.inside and "\n" in title:
+            raise TitlePositionError()
+
+        self.template = template
+        self.title = title
+        self.title_width = 0 if template.inside else line_width(title, template.markup)
+
+        self.lines: List[str] = []
+        self.widths: List[int] = []
+        self.rows: List[str] = []
+        self.longest_line = 0
+
+        # The title lines, if the title is inside the box.
+        self._add(template.split(title, ""))
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def append(self, text: str) -> None:
+        """Appends the lines of a text to the box.
+
+        Arguments
+        ---------
+        text : str
+            The text, an empty text appends an empty line.
+        """
+        self._add(text.splitlines() or [""])
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """Appends the lines of several texts to the box.
+
+        Arguments
+        ---------
+        texts : Iterable[str]
+            The texts, every empty text appends an empty line.
+        """
+        self._add([line for text in texts for line in text.splitlines() or [""]])
+
+    def _add(self, lines: List[str]) -> None:
+        lines, widths, longest_line = self.template.measure(lines)
+
+        self.lines.extend(lines)
+        self.widths.extend(widths)
+
+        row = self.template.row
+
+        # A wider line changes the alignment of every line.
+        if longest_line > self.longest_line:
+            self.longest_line = longest_line
+            lines, widths = self.lines, self.widths
+            self.rows = []
+
+        self.rows.extend(map(row, lines, widths, [self.longest_line] * len(lines)))
+
+    def render(self) -> str:
+        """Returns the box of the lines appended so far, rendered.
+
+        Returns
+        -------
+        str
+            The same as the output of get_box for the lines
+            joined by newlines.
+
+        Raises
+        ------
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        template = self.template
+
+        # n here is essentially the width of the rendered box
+        # including the separators at the end.
+        n = self.longest_line + (template.Px * 2) + 2
+
+        if self.title_width > n - 2:
+            raise TitleLengthError()
+
+        top_bar, bottom_bar = template.bars(n, self.title, self.title_width)
+        padding = template.padding(n)
+
+        # An empty box still has an (unbordered) empty line.
+        rows = self.rows
+        if not rows and not padding:
+            rows = [""]
+
+        lines = itertools.chain([top_bar], padding, rows, padding, [bottom_bar])
+        return template.engine.render("\n".join(lines) + "\n")
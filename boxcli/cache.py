@@ -0,0 +1,115 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+__all__ = ["RenderCache"]
+
+
+class RenderCache:
+    """A bounded least recently used cache of rendered boxes.
+
+    The cache is bounded both by the amount of boxes and by the memory
+    they take up, as reported by ``sys.getsizeof`` for the title, the
+    content and the rendered box. The least recently used boxes are
+    evicted once either bound is exceeded, and boxes that take up more
+    memory than the cache can hold are never cached. A factory caches
+    boxes once caching is enabled with BoxFactory.enable_cache.
+
+    Arguments
+    ---------
+    max_entries : int
+        The maximum amount of cached boxes.
+    max_bytes : int
+        The maximum memory taken up by the cached boxes, in bytes.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 1 << 22) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._boxes: "OrderedDict[Hashable, Tuple[str, int]]" = OrderedDict()
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def get(self, key: Tuple[str, str, Hashable]) -> Optional[str]:
+        """Returns a cached box, or None if it isn't cached.
+
+        Arguments
+        ---------
+        key : Tuple[str, str, Hashable]
+            The title, content and configuration of the box.
+
+        Returns
+        -------
+        Optional[str]
+            The rendered box.
+        """
+        with self._lock:
+            entry = self._boxes.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._boxes.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple[str, str, Hashable], box: str) -> None:
+        """Caches a box, evicting the least recently used ones if needed.
+
+        Arguments
+        ---------
+        key : Tuple[str, str, Hashable]
+            The title, content and configuration of the box.
+        box : str
+            The rendered box.
+        """
+        size = sys.getsizeof(key[0]) + sys.getsizeof(key[1]) + sys.getsizeof(box)
+        if size > self.max_bytes or self.max_entries < 1:
+            return
+
+        with self._lock:
+            old = self._boxes.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+
+            self._boxes[key] = (box, size)
+            self.bytes += size
+
+            while len(self._boxes) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self._boxes.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes every cached box, the counters are kept."""
+        with self._lock:
+            self._boxes.clear()
+            self.bytes = 0
+
+    def as_dict(self) -> dict:
+        """Returns the counters of the cache as a dictionary.
+
+        Returns
+        -------
+        dict
+            The ``hits``, ``misses`` and ``evictions`` counters,
+            and the amount of ``entries`` and ``bytes`` cached.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._boxes),
+                "bytes": self.bytes,
+            }
@@ -0,0 +1,53 @@
+import threading
+import weakref
+from typing import IO, TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+__all__ = ["get_console"]
+
+_lock = threading.Lock()
+
+# The console writing to sys.stdout, and the consoles writing to other
+# files, kept only as long as their file is.
+_stdout_console: Optional["Console"] = None
+_consoles: "weakref.WeakKeyDictionary[IO, Console]" = weakref.WeakKeyDictionary()
+
+
+def get_console(file: Optional[IO] = None) -> "Console":
+    """Returns the console shared by every factory writing to a file.
+
+    Creating a console probes the terminal and the environment, so
+    a console is only created the first time a file is asked for, and
+    shared by every factory that was not given a console of its own.
+
+    Arguments
+    ---------
+    file : Optional[IO]
+        The file the console writes to, or None for sys.stdout.
+
+    Returns
+    -------
+    rich.console.Console
+        The shared console.
+    """
+    global _stdout_console
+
+    console = _stdout_console if file is None else _consoles.get(file)
+    if console is not None:
+        return console
+
+    with _lock:
+        console = _stdout_console if file is None else _consoles.get(file)
+
+        if console is None:
+            from rich.console import Console
+
+            console = Console(file=file)
+            if file is None:
+                _stdout_console = console
+            else:
+                _consoles[file] = console
+
+    return console
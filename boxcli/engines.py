@@ -0,0 +1,287 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+__all__ = ["RichEngine", "AnsiEngine", "PlainEngine"]
+
+
+@lru_cache(maxsize=256)
+def _sgr(colour: Optional[str], color_system: Optional[str]) -> Optional[str]:
+    """Returns the SGR escape sequence that selects a colour.
+
+    The colour is downsampled to the colour system of the terminal
+    the same way rich does it. Every colour is resolved once for every
+    colour system, no matter how many factories use it.
+
+    Arguments
+    ---------
+    colour : Optional[str]
+        A colour name from the colour list or an ``rgb(r,g,b)`` string.
+    color_system : Optional[str]
+        The colour system of the console, as reported by rich.
+
+    Returns
+    -------
+    Optional[str]
+        The escape sequence, or None if no colour should be emitted."""
+
+    if colour is None or color_system is None:
+        return None
+
+    from rich.color import Color
+    from rich.console import COLOR_SYSTEMS
+
+    color = Color.parse(colour).downgrade(COLOR_SYSTEMS[color_system])
+    return f"\x1b[{';'.join(color.get_ansi_codes())}m"
+
+
+def _open_tags(text: str, tags: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Returns the markup tags still open at the end of a text.
+
+    Tags are opened and closed the way rich.markup.render does it.
+
+    Arguments
+    ---------
+    text : str
+        The text, with markup.
+    tags : list[tuple[str, str]]
+        The normalized names and the markup of the tags open at
+        the start of the text.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        The normalized names and the markup of the tags open at
+        the end of the text, in the order they were opened."""
+
+    from rich.markup import RE_TAGS
+    from rich.style import Style
+
+    tags = list(tags)
+
+    for match in RE_TAGS.finditer(text):
+        escape_open, tag_text = match.groups()
+        if escape_open:
+            continue
+
+        name, equals, _ = tag_text.partition("=")
+        if not equals:
+            name = tag_text.strip()
+
+        if not name.startswith("/"):
+            tags.append((Style.normalize(name), match.group(0)))
+            continue
+
+        # An explicit close closes the last tag of the same name, an
+        # implicit one the last tag. A close that doesn't match is
+        # left for rich to report.
+        closed = name[1:].strip()
+        if closed:
+            closed = Style.normalize(closed)
+
+        for index in range(len(tags) - 1, -1, -1):
+            if not closed or tags[index][0] == closed:
+                del tags[index]
+                break
+
+    return tags
+
+
+class RichEngine:
+    """Renders boxes through a rich console.
+
+    The border is coloured with rich markup, and the whole box
+    is printed into a capture of the console. Markup in the title
+    and content is processed, and lines wider than the console
+    are wrapped.
+
+    Escape sequences in the title and content take up no cells when
+    the box is laid out. Rich counts their characters as cells and
+    highlights them, so a text with escape sequences is printed
+    without highlighting or wrapping, which passes them through to
+    the output as they are.
+
+    Arguments
+    ---------
+    console : rich.console.Console
+        The console used to render boxes.
+    colour : Optional[str]
+        The colour of the box border, or None for no colour.
+    """
+
+    # Whether render only terminates the text with a newline.
+    passthrough = False
+
+    # Whether markup in the title and content is processed.
+    markup = True
+
+    def __init__(self, console: "Console", colour: Optional[str]) -> None:
+        self.console = console
+        self.colour = colour
+
+    def paint(self, text: str) -> str:
+        """Returns the text coloured with the border colour."""
+        if self.colour is not None:
+            return f"[{self.colour}]{text}[/{self.colour}]"
+        return text
+
+    def _print(self, text: str) -> None:
+        if "\x1b" in text:
+            self.console.print(text, highlight=False, soft_wrap=True)
+        else:
+            self.console.print(text)
+
+    def render(self, text: str) -> str:
+        """Returns the output of printing the text to the console."""
+        with self.console.capture() as capture:
+            self._print(text)
+
+        return capture.get()
+
+    def render_many(self, texts: List[str]) -> List[str]:
+        """Returns the outputs of printing every text to the console.
+
+        Every text is printed separately, so markup can't leak from
+        one text into the next, but into a single capture of the
+        console. The captured output is then split back up by the
+        amount of lines printed for every text.
+        """
+        with self.console.capture() as capture:
+            for text in texts:
+                self._print(text)
+
+        output = capture.get().split("\n")
+
+        # Every text is printed with an extra newline at the end.
+        counts = [text.count("\n") + 1 for text in texts]
+
+        # If rich wrapped any of the lines the output can't be split
+        # back up, so fall back to printing the texts one at a time.
+        if len(output) != sum(counts) + 1:
+            return [self.render(text) for text in texts]
+
+        outputs = []
+        start = 0
+
+        for count in counts:
+            end = start + count
+            outputs.append("\n".join(output[start:end]) + "\n")
+            start = end
+
+        return outputs
+
+    def render_chunks(self, texts: Iterable[str]) -> Iterator[str]:
+        """Yields the outputs of printing the chunks of a text one at a time.
+
+        Markup can span the lines of a box, so the tags still open at
+        the end of a chunk are closed, and opened again at the start
+        of the next one. Together the outputs are the same as the
+        output of printing the chunks joined by newlines.
+        """
+        tags: List[Tuple[str, str]] = []
+
+        for text in texts:
+            if not tags:
+                tags = _open_tags(text, tags)
+                yield self.render(text + "[/]" * len(tags))
+                continue
+
+            # The tags are opened before the newline that ends the last
+            # chunk, like they are in the whole text, so styles opened
+            # at the start of the chunk take precedence over them.
+            opened = "".join(markup for _, markup in tags)
+            tags = _open_tags(text, tags)
+            output = self.render(f"{opened}\n{text}" + "[/]" * len(tags))
+            start = output.index("\n") + 1
+            yield output[start:]
+
+
+class AnsiEngine:
+    """Renders boxes by writing SGR escape codes directly.
+
+    The border colour is resolved to an escape sequence once, for the
+    colour system of the console, so rendering never goes through
+    rich. The title and content are written as they are: markup is
+    not processed, lines are not wrapped and nothing is highlighted.
+    The RichEngine highlights numbers, booleans, brackets and the
+    like in them, so the output only matches that of the RichEngine
+    for the same colour system when there is nothing to highlight,
+    or when the console has no colour system.
+
+    Arguments
+    ---------
+    console : rich.console.Console
+        The console whose colour system is used.
+    colour : Optional[str]
+        The colour of the box border, or None for no colour.
+    """
+
+    passthrough = True
+    markup = False
+
+    def __init__(self, console: "Console", colour: Optional[str]) -> None:
+        self.console = console
+        self.colour = colour
+        self.sgr = _sgr(colour, console.color_system)
+
+    def paint(self, text: str) -> str:
+        """Returns the text coloured with the border colour."""
+        if self.sgr is not None and text:
+            return f"{self.sgr}{text}\x1b[0m"
+        return text
+
+    def render(self, text: str) -> str:
+        """Returns the text as it would be printed."""
+        return text + "\n"
+
+    def render_many(self, texts: List[str]) -> List[str]:
+        """Returns every text as it would be printed."""
+        return [text + "\n" for text in texts]
+
+    def render_chunks(self, texts: Iterable[str]) -> Iterator[str]:
+        """Yields the chunks of a text as they would be printed."""
+        for text in texts:
+            yield text + "\n"
+
+
+class PlainEngine:
+    """Renders boxes as plain text, without colour.
+
+    The engine never imports rich and doesn't need a console, so the
+    output doesn't depend on the terminal. The title and content are
+    written as they are: markup is not processed and lines are not
+    wrapped.
+
+    Arguments
+    ---------
+    console : Optional[rich.console.Console]
+        Unused, accepted so every engine is created the same way.
+    colour : Optional[str]
+        Unused, plain boxes have no colour.
+    """
+
+    passthrough = True
+    markup = False
+
+    def __init__(self, console: Optional["Console"], colour: Optional[str]) -> None:
+        self.console = console
+        self.colour = None
+
+    def paint(self, text: str) -> str:
+        """Returns the text as it is."""
+        return text
+
+    def render(self, text: str) -> str:
+        """Returns the text as it would be printed."""
+        return text + "\n"
+
+    def render_many(self, texts: List[str]) -> List[str]:
+        """Returns every text as it would be printed."""
+        return [text + "\n" for text in texts]
+
+    def render_chunks(self, texts: Iterable[str]) -> Iterator[str]:
+        """Yields the chunks of a text as they would be printed."""
+        for text in texts:
+            yield text + "\n"
@@ -0,0 +1,202 @@
+import sys
+import threading
+import time
+from typing import IO, List, Optional
+
+from .box import BoxFactory
+
+__all__ = ["LiveBox"]
+
+
+class LiveBox:
+    """A box that is redrawn in place as its content changes.
+
+    The lines of the last drawn box are kept, and an update only
+    rewrites the lines that changed, moving the cursor to them with
+    escape sequences. The whole box is redrawn only when its width
+    changes. Updates that arrive faster than the refresh rate are
+    held back, the latest one is drawn by the next update after the
+    interval, by refresh or when the live box is closed.
+
+    The live box can be used as a context manager, which draws any
+    held back update and leaves the cursor below the box on exit.
+
+    Arguments
+    ---------
+    factory : BoxFactory
+        The factory whose settings are used to render the box.
+    title : str
+        The title of the box.
+    content : str
+        The content of the box.
+
+    Keyword Arguments
+    -----------------
+    file : IO[str]
+        The terminal the box is drawn on.
+        Defaults to sys.stdout
+    refresh_per_second : Optional[float]
+        The maximum amount of times the box is drawn per second,
+        or None to draw every update.
+        Defaults to 10
+    """
+
+    def __init__(
+        self,
+        factory: BoxFactory,
+        title: str = "",
+        content: str = "",
+        **kwargs,
+    ) -> None:
+        self.factory = factory
+        self.title = title
+        self.content = content
+
+        self.file: IO[str] = kwargs.get("file") or sys.stdout
+        self.refresh_per_second: Optional[float] = kwargs.get(
+            "refresh_per_second", 10.0
+        )
+
+        self._lock = threading.Lock()
+
+        # The lines and the width of the box currently on the terminal.
+        self._lines: List[str] = []
+        self._width = -1
+
+        self._last_draw = float("-inf")
+        self._pending = True
+
+    def __enter__(self) -> "LiveBox":
+        self.refresh()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(
+        self,
+        content: Optional[str] = None,
+        title: Optional[str] = None,
+        force: bool = False,
+    ) -> bool:
+        """Updates the box, redrawing it unless the refresh rate is exceeded.
+
+        Arguments
+        ---------
+        content : Optional[str]
+            The new content of the box, if it changed.
+        title : Optional[str]
+            The new title of the box, if it changed.
+        force : bool
+            Draw the box even if the refresh rate is exceeded.
+
+        Returns
+        -------
+        bool
+            Whether the box was drawn.
+
+        Raises
+        ------
+        TitlePositionError
+            If the position of the title is not TitlePosition.INSIDE
+            and yet it contains a newline.
+        TitleLengthError
+            If the length of the title is larger than the
+            length of the largest line in the content.
+        """
+        with self._lock:
+            if content is not None:
+                self.content = content
+            if title is not None:
+                self.title = title
+            self._pending = True
+
+            if not force and self.refresh_per_second:
+                interval = 1 / self.refresh_per_second
+                if time.monotonic() - self._last_draw < interval:
+                    return False
+
+            self._draw()
+            return True
+
+    def refresh(self) -> None:
+        """Draws the latest update, if it hasn't been drawn yet."""
+        with self._lock:
+            if self._pending:
+                self._draw()
+
+    def close(self) -> None:
+        """Draws the latest update, leaving the cursor below the box."""
+        self.refresh()
+
+    def _render(self) -> List[str]:
+        """Renders the box, returning its lines and setting its width."""
+        template = self.factory._get_template()
+
+        lines, widths, longest_line = template.measure(
+            template.split(self.title, self.content)
+        )
+        layout = template.lines(self.title, lines, widths, longest_line)
+
+        # Render the box in one go, like get_box does, so markup
+        # spanning several lines is processed the same way.
+        rendered = template.engine.render("\n".join(layout) + "\n")
+
+        self._width = longest_line + (template.Px * 2) + 2
+        return rendered.split("\n")[:-2]
+
+    def _draw(self) -> None:
+        """Writes the changes between the drawn box and the current one."""
+        old, old_width = self._lines, self._width
+        new = self._render()
+
+        # The cursor sits at the start of the line below the box.
+        if not old:
+            output = [line + "\n" for line in new]
+        elif self._width != old_width:
+            output = [f"\x1b[{len(old)}A\r\x1b[J"]
+            output.extend(line + "\n" for line in new)
+        else:
+            output = self._diff(old, new)
+
+        self._lines = new
+        self._pending = False
+        self._last_draw = time.monotonic()
+
+        if output:
+            self.file.write("".join(output))
+            self.file.flush()
+
+    @staticmethod
+    def _diff(old: List[str], new: List[str]) -> List[str]:
+        """Returns the output that turns the old lines into the new lines."""
+        output = []
+        row = len(old)
+
+        for i, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                output.append(_move(row, i))
+                output.append(f"\r{after}\x1b[K\n")
+
+                # Moving down a line leaves the cursor at the start of it.
+                row = i + 1
+
+        shared = min(len(old), len(new))
+        output.append(_move(row, shared))
+
+        if len(new) > len(old):
+            output.extend(line + "\n" for line in new[shared:])
+        elif len(new) < len(old):
+            # The cursor is below the last new line, clear the rest.
+            output.append("\x1b[J")
+
+        return output
+
+
+def _move(row: int, to: int) -> str:
+    """Returns the escape sequence that moves the cursor between rows."""
+    if to < row:
+        return f"\x1b[{row - to}A"
+    if to > row:
+        return f"\x1b[{to - row}B"
+    return ""
@@ -0,0 +1,110 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .box import BoxFactory, RenderEngine
+
+__all__ = ["render_parallel"]
+
+# The factory of a worker process, created once by _init_worker.
+_factory: Optional[BoxFactory] = None
+
+
+def _factory_settings(factory: BoxFactory) -> dict:
+    """Returns the picklable settings of a factory and its console.
+
+    The console itself can't be sent to another process, so the
+    settings that affect the rendered output are sent instead."""
+
+    # Don't read the settings while another thread updates them.
+    with factory._lock:
+        settings = {
+            "Px": factory.Px,
+            "Py": factory.Py,
+            "style": factory.style,
+            "alignment": factory.alignment,
+            "title_pos": factory.title_position,
+            "engine": factory.engine,
+            "colour": factory.colour,
+            "max_width": factory.max_width,
+            "console": None,
+        }
+
+        # The plain engine doesn't need a console, don't create one.
+        if factory.engine != RenderEngine.PLAIN or factory._console is not None:
+            console = factory.console
+            settings["console"] = {
+                "color_system": console.color_system,
+                "force_terminal": console.is_terminal,
+                "width": console.width,
+                "legacy_windows": console.legacy_windows,
+            }
+
+        return settings
+
+
+def _init_worker(settings: dict) -> None:
+    """Creates the factory of a worker process from the settings."""
+    global _factory
+
+    settings = dict(settings)
+    console = settings.pop("console")
+    colour = settings.pop("colour")
+
+    if console is not None:
+        from rich.console import Console
+
+        console = Console(**console)
+
+    _factory = BoxFactory(
+        settings.pop("Px"), settings.pop("Py"), console=console, **settings
+    )
+
+    # The colour has already been resolved by the parent factory.
+    _factory.colour = colour
+
+
+def _render_chunk(pairs: List[Tuple[str, str]]) -> List[str]:
+    """Renders a chunk of boxes with the factory of the worker process."""
+    return _factory.get_boxes(pairs)
+
+
+def render_parallel(
+    factory: BoxFactory,
+    pairs: Iterable[Tuple[str, str]],
+    processes: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[str]:
+    """Yields boxes rendered by a pool of worker processes.
+
+    The settings of the factory are sent to every worker once, when
+    the worker starts, and the pairs are sent in chunks.
+
+    Arguments
+    ---------
+    factory : BoxFactory
+        The factory whose settings are used to render the boxes.
+    pairs : Iterable[Tuple[str, str]]
+        The (title, content) pairs of the boxes.
+    processes : Optional[int]
+        The amount of worker processes.
+        Defaults to the amount of CPUs.
+    chunk_size : int
+        The amount of boxes sent to a worker at a time.
+        Defaults to 1000
+
+    Yields
+    ------
+    str
+        The rendered boxes, in the same order as the pairs.
+    """
+    pairs = iter(pairs)
+    chunks = iter(lambda: list(itertools.islice(pairs, chunk_size)), [])
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(_factory_settings(factory),),
+    ) as executor:
+        for boxes in executor.map(_render_chunk, chunks):
+            yield from boxes
@@ -0,0 +1,157 @@
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from .box import BoxTemplate, TitlePosition
+from .engines import PlainEngine
+from .width import line_width
+
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions
+    from rich.measure import Measurement
+    from rich.segment import Segment
+
+__all__ = ["BoxRenderable"]
+
+
+class BoxRenderable:
+    """A box that rich renders natively.
+
+    The box is laid out once, when it is created, and rendered by rich
+    as segments, so it can be printed by any console or embedded in
+    rich layouts, tables and live displays without being captured and
+    parsed again. When rich renders it in less space than it takes up,
+    in a narrow table column for example, the content is wrapped to
+    fit that space instead, and that layout is kept for the next
+    render. The border is coloured with the colour of the
+    factory, downsampled to the colour system of the console that
+    renders it. Like with the ANSI engine, the title and content are
+    written as they are: markup is not processed.
+
+    Arguments
+    ---------
+    template : BoxTemplate
+        The template of the factory that created the box.
+    title : str
+        The title of the box.
+    content : str
+        The content of the box.
+
+    Raises
+    ------
+    TitlePositionError
+        If the position of the title is not TitlePosition.INSIDE
+        and yet it contains a newline.
+    TitleLengthError
+        If the length of the title is larger than the
+        length of the largest line in the content.
+    """
+
+    def __init__(self, template: BoxTemplate, title: str, content: str) -> None:
+        self.title = title
+        self.content = content
+        self.colour = template.engine.colour
+        self.style = template.style
+        self.title_position = template.title_position
+
+        # Lay the box out without colour, the border is styled
+        # when the box is rendered.
+        self._settings = (
+            template.Px,
+            template.Py,
+            template.style,
+            template.alignment,
+            template.title_position,
+            PlainEngine(None, None),
+        )
+
+        self.lines, self.width = self._layout(template.max_width)
+
+        # The width of the box laid out as narrow as it goes, and the
+        # last layout that was narrower than the box.
+        self._minimum: Optional[int] = None
+        self._narrow: Tuple[int, List[str], int] = (0, self.lines, self.width)
+
+    def _measure(
+        self, max_width: int, narrow: bool
+    ) -> Tuple[BoxTemplate, List[str], List[int], int]:
+        """Measures the lines of the box for a maximum width.
+
+        A narrow box is widened to fit its title, instead of raising
+        TitleLengthError when it is laid out."""
+        plain = BoxTemplate(*self._settings, max_width)
+        lines, widths, longest_line = plain.measure(
+            plain.split(self.title, self.content)
+        )
+
+        if narrow and not plain.inside:
+            title_width = line_width(self.title)
+            longest_line = max(longest_line, title_width + 2 - (plain.Px * 2))
+
+        return plain, lines, widths, longest_line
+
+    def _layout(self, max_width: int, narrow: bool = False) -> Tuple[List[str], int]:
+        """Returns the lines and the width of the box laid out for a width."""
+        plain, lines, widths, longest_line = self._measure(max_width, narrow)
+
+        lines = list(plain.lines(self.title, lines, widths, longest_line))
+        return lines, longest_line + (plain.Px * 2) + 2
+
+    def _fit(self, max_width: int) -> Tuple[List[str], int]:
+        """Returns the lines and the width of the box laid out to fit
+        in a width, if it doesn't already."""
+        if self.width <= max_width:
+            return self.lines, self.width
+
+        fitted, lines, width = self._narrow
+        if fitted != max_width:
+            lines, width = self._layout(max_width, narrow=True)
+            self._narrow = (max_width, lines, width)
+
+        return lines, width
+
+    def __rich_measure__(self, console: "Console", max_width: int) -> "Measurement":
+        from rich.measure import Measurement
+
+        # Every line can be wrapped down to a cell, so the box is only
+        # measured once as narrow as it goes.
+        if self._minimum is None:
+            plain, _, _, longest_line = self._measure(1, narrow=True)
+            self._minimum = longest_line + (plain.Px * 2) + 2
+
+        return Measurement(min(self._minimum, self.width), self.width)
+
+    def __rich_console__(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Iterator["Segment"]:
+        from rich.segment import Segment
+        from rich.style import Style
+
+        # Parsed styles are shared, and a style keeps the escape codes
+        # of the first colour system it was rendered for, so the border
+        # style is created for every render.
+        border = Style(color=self.colour) if self.colour else None
+        lines, _ = self._fit(options.max_width)
+        last = len(lines) - 1
+
+        # The index of the bar the title is in, and the length of its corner.
+        title_bar, corner = -1, 0
+        if self.title_position == TitlePosition.TOP:
+            title_bar, corner = 0, len(self.style.top_left)
+        elif self.title_position == TitlePosition.BOTTOM:
+            title_bar, corner = last, len(self.style.bottom_left)
+
+        side = len(self.style.vertical)
+
+        for i, line in enumerate(lines):
+            if i == title_bar:
+                end = corner + len(self.title) + 2
+                yield Segment(line[:corner], border)
+                yield Segment(line[corner:end])
+                yield Segment(line[end:], border)
+            elif i == 0 or i == last:
+                yield Segment(line, border)
+            elif line:
+                yield Segment(line[:side], border)
+                yield Segment(line[side:-side])
+                yield Segment(line[-side:], border)
+
+            yield Segment.line()
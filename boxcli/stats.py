@@ -0,0 +1,105 @@
+import threading
+from typing import Callable, Dict, Optional
+
+__all__ = ["RenderStats"]
+
+
+class RenderStats:
+    """Cumulative statistics of the boxes rendered by a factory.
+
+    The time spent rendering is split in three phases: ``measure``,
+    splitting the content in lines and measuring their widths,
+    ``layout``, aligning the lines and enclosing them in the border,
+    and ``render``, passing the laid out box through the render
+    engine. Statistics are collected by a factory once they are
+    enabled with BoxFactory.enable_stats.
+
+    Only boxes rendered with get_box, get_boxes and iter_boxes are
+    counted, as those are rendered phase by phase. Grids, boxes that
+    are written or streamed a chunk of lines at a time (render_to,
+    render_file, write_box_async and stream), and the buffers of
+    get_box_buffers and get_box_bytes are not, except that with the
+    rich engine the buffers are rendered with get_box.
+
+    Arguments
+    ---------
+    callback : Optional[Callable[[dict], None]]
+        Called after every render with the statistics of that
+        render, in the same format as as_dict.
+    """
+
+    phases = ("measure", "layout", "render")
+
+    def __init__(self, callback: Optional[Callable[[dict], None]] = None) -> None:
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets all the statistics to zero."""
+        with self._lock:
+            self.renders = 0
+            self.lines = 0
+            self.bytes = 0
+            self.seconds: Dict[str, float] = dict.fromkeys(self.phases, 0.0)
+
+    def record(
+        self,
+        renders: int,
+        lines: int,
+        size: int,
+        measure: float,
+        layout: float,
+        render: float,
+    ) -> None:
+        """Adds the statistics of a render, and calls the callback.
+
+        Arguments
+        ---------
+        renders : int
+            The amount of boxes rendered.
+        lines : int
+            The amount of laid out lines.
+        size : int
+            The size of the rendered output in bytes, encoded as UTF-8.
+        measure : float
+            The seconds spent in the measure phase.
+        layout : float
+            The seconds spent in the layout phase.
+        render : float
+            The seconds spent in the render phase.
+        """
+        with self._lock:
+            self.renders += renders
+            self.lines += lines
+            self.bytes += size
+            self.seconds["measure"] += measure
+            self.seconds["layout"] += layout
+            self.seconds["render"] += render
+
+        if self.callback is not None:
+            self.callback(
+                {
+                    "renders": renders,
+                    "lines": lines,
+                    "bytes": size,
+                    "seconds": {"measure": measure, "layout": layout, "render": render},
+                }
+            )
+
+    def as_dict(self) -> dict:
+        """Returns the statistics as a dictionary.
+
+        Returns
+        -------
+        dict
+            The ``renders``, ``lines`` and ``bytes`` counters, and the
+            cumulative ``seconds`` spent in every phase.
+        """
+        with self._lock:
+            return {
+                "renders": self.renders,
+                "lines": self.lines,
+                "bytes": self.bytes,
+                "seconds": dict(self.seconds),
+            }
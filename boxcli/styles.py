@@ -11,6 +11,10 @@ class RawStyle:
     single character strings or single digit ints. If you pass
     anything else the Box rendering WILL break.
 
+    Styles are immutable and compare equal when all their parts
+    are equal, so they can be used as dictionary keys. A style
+    with the same parts as a builtin style is that builtin style.
+
 
     Arguments
     ---------
@@ -18,20 +22,73 @@ class RawStyle:
         A dictionary with the format described above.
     """
 
-    def __init__(self, parts: dict) -> None:
-        self.horizontal = str(parts.get("horizontal", "-"))
-        self.vertical = str(parts.get("vertical", "|"))
-        self.top_left = str(parts.get("top_left", "+"))
-        self.top_right = str(parts.get("top_right", "+"))
-        self.bottom_left = str(parts.get("bottom_left", "+"))
-        self.bottom_right = str(parts.get("bottom_right", "+"))
+    __slots__ = (
+        "horizontal",
+        "vertical",
+        "top_left",
+        "top_right",
+        "bottom_left",
+        "bottom_right",
+    )
+
+    # The builtin styles, keyed by their parts.
+    _interned: typing.Dict[typing.Tuple[str, ...], "RawStyle"] = {}
+
+    def __new__(cls, parts: dict) -> "RawStyle":
+        key = tuple(
+            str(parts.get(name, default))
+            for name, default in zip(cls.__slots__, "-|++++")
+        )
+
+        if cls is RawStyle and key in cls._interned:
+            return cls._interned[key]
+
+        self = super().__new__(cls)
+        for name, part in zip(cls.__slots__, key):
+            object.__setattr__(self, name, part)
+        return self
+
+    def _parts(self) -> typing.Tuple[str, ...]:
+        return (
+            self.horizontal,
+            self.vertical,
+            self.top_left,
+            self.top_right,
+            self.bottom_left,
+            self.bottom_right,
+        )
+
+    def _intern(self) -> "RawStyle":
+        """Makes this the instance returned for its parts."""
+        return RawStyle._interned.setdefault(self._parts(), self)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawStyle):
+            return NotImplemented
+        return self is other or self._parts() == other._parts()
+
+    def __hash__(self) -> int:
+        return hash(self._parts())
+
+    def __reduce__(self) -> tuple:
+        return type(self), (dict(zip(self.__slots__, self._parts())),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(zip(self.__slots__, self._parts()))!r})"
 
 
 class RGB:
     """Represents a colour in RGB format.
 
     This can be used to specify a custom box colour with
-    preferred RGB colour value.
+    preferred RGB colour value. Colours are immutable and
+    compare equal when their values are equal.
 
     Arguments
     ---------
@@ -44,6 +101,8 @@ class RGB:
         If the values inside the tuple exceed the RGB range.
     """
 
+    __slots__ = ("rgb",)
+
     def __init__(self, rgb: typing.Tuple[int, int, int]) -> None:
         # Check if the values are valid RGB values.
         for x in rgb:
@@ -52,7 +111,32 @@ class RGB:
 
         # Create a string out of these values.
         # Mainly to support quick interop with `rich`.
-        self.rgb = f"rgb({rgb[0]},{rgb[1]},{rgb[2]})"
+        # Colours are immutable, so the slot is set directly.
+        object.__setattr__(self, "rgb", f"rgb({rgb[0]},{rgb[1]},{rgb[2]})")
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RGB):
+            return NotImplemented
+        return self.rgb == other.rgb
+
+    def __hash__(self) -> int:
+        return hash(self.rgb)
+
+    def _value(self) -> typing.Tuple[int, int, int]:
+        r, g, b = self.rgb[4:-1].split(",")
+        return int(r), int(g), int(b)
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self._value(),)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._value()!r})"
 
     @classmethod
     def from_hex(cls, hex_code: int):
@@ -164,6 +248,9 @@ default_styles = {
     ),
 }
 
+# Every style with the parts of a builtin style is that builtin style.
+default_styles = {key: style._intern() for key, style in default_styles.items()}
+
 # alignments dictionary
 alignments = {
     1: "{sep}{sp}{ln}{os}{sp}{sep}",
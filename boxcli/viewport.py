@@ -0,0 +1,88 @@
+from typing import List
+
+from .box import BoxTemplate
+
+__all__ = ["BoxViewport"]
+
+
+class BoxViewport:
+    """A box of which only a window of content lines is rendered.
+
+    The content is split and measured once, when the viewport is
+    created, and the lines, their widths and the width of the longest
+    line are kept. Rendering a window then only lays out the lines in
+    it, so scrolling through a huge box costs as much as the window
+    and not as much as the content. Every window is as wide as the
+    whole box, and a title inside the box stays at the top of it.
+
+    Arguments
+    ---------
+    template : BoxTemplate
+        The template of the factory that created the viewport.
+    title : str
+        The title of the box.
+    content : str
+        The content of the box.
+
+    Raises
+    ------
+    TitlePositionError
+        If the position of the title is not TitlePosition.INSIDE
+        and yet it contains a newline.
+    TitleLengthError
+        If the length of the title is larger than the
+        length of the largest line in the content.
+    """
+
+    def __init__(self, template: BoxTemplate, title: str, content: str) -> None:
+        self.template = template
+        self.title = title
+
+        # The title lines, if the title is inside the box.
+        self.title_lines, self.title_widths, longest_title = template.measure(
+            template.split(title, "")
+        )
+
+        self.lines: List[str]
+        self.lines, self.widths, longest_line = template.measure(content.splitlines())
+        self.longest_line = max(longest_title, longest_line)
+
+        # Lay out the top bar once, so an invalid title raises right away.
+        next(template.lines(title, [], [], self.longest_line))
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def render(self, offset: int = 0, limit: int = 40) -> str:
+        """Returns a window of the box, rendered.
+
+        Arguments
+        ---------
+        offset : int
+            The index of the first content line in the window.
+            Defaults to 0
+        limit : int
+            The maximum amount of content lines in the window.
+            Defaults to 40
+
+        Returns
+        -------
+        str
+            The window, enclosed in the bars of the box.
+
+        Raises
+        ------
+        ValueError
+            If the offset or the limit is negative.
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("The offset and limit of a window can't be negative.")
+
+        template = self.template
+        end = offset + limit
+
+        lines = self.title_lines + self.lines[offset:end]
+        widths = self.title_widths + self.widths[offset:end]
+        rows = template.lines(self.title, lines, widths, self.longest_line)
+
+        return template.engine.render("\n".join(rows) + "\n")
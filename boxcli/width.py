@@ -0,0 +1,312 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+__all__ = ["line_width", "char_width", "measure_lines", "wrap_line", "fold_line"]
+
+# An escape sequence: a CSI sequence such as SGR, an OSC sequence such
+# as a hyperlink, ended by BEL or ST, or any other two character escape.
+_ESCAPE = r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])"
+
+# The tags rich processes as markup, and the escaped brackets it
+# prints as ``[``, as matched by rich.markup.
+_MARKUP = r"\\(\[)|\[[a-z#/].*?\]"
+
+# The scanners that find the parts of a line that take up no cells,
+# without and with markup. Both are compiled once, and every line is
+# scanned by a single one of them in a single pass.
+_scanners = {
+    False: re.compile(_ESCAPE),
+    True: re.compile(f"{_ESCAPE}|{_MARKUP}"),
+}
+
+
+def _strip(line: str, markup: bool) -> str:
+    """Returns a line without the parts that take up no cells."""
+    # Expanding the group in every replacement is a lot slower than
+    # replacing with nothing, and escaped brackets are rare.
+    if markup and "\\[" in line:
+        return _scanners[True].sub(r"\1", line)
+    return _scanners[markup].sub("", line)
+
+
+@lru_cache(maxsize=4096)
+def _wcwidth(char: str) -> int:
+    """Returns the width of a character, as wcwidth does, memoized."""
+    from wcwidth import wcwidth
+
+    return wcwidth(char)
+
+
+@lru_cache(maxsize=4096)
+def _cached_wcswidth(line: str) -> int:
+    """Returns the width of a line, memoized for repeated lines."""
+
+    # Joiners and variation selectors change the width of the
+    # characters around them, anything else is measured on its own.
+    if "\u200d" in line or "\ufe0f" in line:
+        from wcwidth import wcswidth
+
+        return wcswidth(line)
+
+    widths = list(map(_wcwidth, line))
+
+    # wcswidth gives up on the first control character.
+    if min(widths, default=0) < 0:
+        return -1
+    return sum(widths)
+
+
+def _has_hidden(line: str, markup: bool) -> bool:
+    """Returns whether a line may contain parts that take up no cells."""
+    return "\x1b" in line or (markup and "[" in line)
+
+
+def _spans(line: str, markup: bool) -> Dict[int, Tuple[int, int]]:
+    """Returns the end and width of every part of a line found by the scanner.
+
+    Escape sequences and markup tags take up no cells. An escaped
+    bracket is printed as the bracket, and is kept in one piece
+    so rich still reads it as escaped."""
+    return {
+        match.start(): (match.end(), 1 if match.lastindex else 0)
+        for match in _scanners[markup].finditer(line)
+    }
+
+
+def line_width(line: str, markup: bool = False) -> int:
+    """Returns the width of a line in terminal cells.
+
+    Every width check of a box goes through this function.
+    Printable ASCII lines are measured with ``len``, any other
+    line is measured with wcwidth through a bounded LRU cache.
+    Escape sequences, such as the SGR sequences of coloured text,
+    take up no cells, and neither does markup if it is processed.
+    They are removed by a precompiled scanner in a single pass
+    before the line is measured.
+
+    Arguments
+    ---------
+    line : str
+        The line to measure.
+    markup : bool
+        Whether rich markup in the line is processed.
+        Defaults to False
+
+    Returns
+    -------
+    int
+        The width of the line, or -1 if the line contains
+        control characters."""
+
+    # str.isascii is O(1), and an ASCII line is one cell per
+    # character as long as there are no control characters.
+    if line.isascii() and line.isprintable() and not (markup and "[" in line):
+        return len(line)
+
+    if _has_hidden(line, markup):
+        line = _strip(line, markup)
+
+        if line.isascii() and line.isprintable():
+            return len(line)
+
+    return _cached_wcswidth(line)
+
+
+@lru_cache(maxsize=4096)
+def char_width(char: str) -> int:
+    """Returns the width of a character in terminal cells.
+
+    Characters are measured one at a time when lines are wrapped or
+    folded, so their widths are memoized.
+
+    Arguments
+    ---------
+    char : str
+        The character to measure.
+
+    Returns
+    -------
+    int
+        The width of the character, control characters
+        are zero cells wide."""
+
+    if " " <= char <= "~":
+        return 1
+
+    from wcwidth import wcwidth
+
+    return max(wcwidth(char), 0)
+
+
+def measure_lines(lines: List[str], markup: bool = False) -> Tuple[List[int], int]:
+    """Measures every line exactly once.
+
+    Arguments
+    ---------
+    lines : list[str]
+        A list of lines
+    markup : bool
+        Whether rich markup in the lines is processed.
+        Defaults to False
+
+    Returns
+    -------
+    tuple[list[int], int]
+        The widths of the lines and the width of the longest line."""
+
+    widths = [line_width(line, markup) for line in lines]
+    return widths, max(max(widths, default=0), 0)
+
+
+def wrap_line(line: str, width: int, markup: bool = False) -> List[Tuple[str, int]]:
+    """Wraps a line into pieces that are at most as wide as the width.
+
+    The line is broken at the last space that fits in a piece, and
+    the space is dropped. A word wider than the width is broken where
+    the piece is full. Every character is measured once, in a single
+    pass over the line, and the widths of the pieces are kept from
+    that pass. Escape sequences and processed markup are never broken,
+    and take up no cells.
+
+    Arguments
+    ---------
+    line : str
+        The line to wrap.
+    width : int
+        The maximum width of a piece, at least 1.
+    markup : bool
+        Whether rich markup in the line is processed.
+        Defaults to False
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        The pieces of the line along with their widths."""
+
+    pieces = []
+    start = 0
+
+    # Every character of a printable ASCII line is a cell wide, so the
+    # pieces can be found by index, with str.rfind for the spaces.
+    if line.isascii() and line.isprintable() and not (markup and "[" in line):
+        end = len(line)
+
+        while end - start > width:
+            stop = start + width
+            space = line.rfind(" ", start + 1, stop + 1)
+
+            if space == -1:
+                pieces.append((line[start:stop], width))
+                start = stop
+            else:
+                pieces.append((line[start:space], space - start))
+                start = space + 1
+
+        pieces.append((line[start:], end - start))
+        return pieces
+
+    # The parts found by the scanner, by their starts.
+    spans = _spans(line, markup) if _has_hidden(line, markup) else None
+    skip = 0
+
+    # The last space in the current piece, and the width before it.
+    space = space_length = -1
+    length = 0
+
+    for index, char in enumerate(line):
+        if spans is None:
+            width_of_char = char_width(char)
+        elif index < skip:
+            continue
+        elif index in spans:
+            skip, width_of_char = spans[index]
+            if not width_of_char:
+                continue
+        else:
+            width_of_char = char_width(char)
+
+        if length + width_of_char > width and index > start:
+            # A space that doesn't fit ends the piece, and is dropped.
+            if char == " ":
+                pieces.append((line[start:index], length))
+                start = index + 1
+                length = 0
+                continue
+
+            if space > start:
+                pieces.append((line[start:space], space_length))
+                length -= space_length + 1
+                start = space + 1
+
+            # What is left after the space may still not fit.
+            if length + width_of_char > width and index > start:
+                pieces.append((line[start:index], length))
+                start = index
+                length = 0
+
+        if char == " ":
+            space = index
+            space_length = length
+
+        length += width_of_char
+
+    pieces.append((line[start:], length))
+    return pieces
+
+
+def fold_line(line: str, width: int, markup: bool = False) -> List[Tuple[str, int]]:
+    """Folds a line into pieces that are at most as wide as the width.
+
+    Unlike wrap_line, the line is broken wherever a piece is full.
+    Escape sequences and processed markup are never broken, and take
+    up no cells.
+
+    Arguments
+    ---------
+    line : str
+        The line to fold.
+    width : int
+        The maximum width of a piece.
+    markup : bool
+        Whether rich markup in the line is processed.
+        Defaults to False
+
+    Returns
+    -------
+    list[tuple[str, int]]
+        The pieces of the line along with their widths."""
+
+    length = line_width(line, markup)
+    if 0 <= length <= width:
+        return [(line, length)]
+
+    # The parts found by the scanner, by their starts.
+    spans = _spans(line, markup) if _has_hidden(line, markup) else None
+    skip = 0
+
+    pieces = []
+    start = 0
+    length = 0
+
+    for index, char in enumerate(line):
+        if spans is None:
+            width_of_char = char_width(char)
+        elif index < skip:
+            continue
+        elif index in spans:
+            skip, width_of_char = spans[index]
+            if not width_of_char:
+                continue
+        else:
+            width_of_char = char_width(char)
+
+        if length + width_of_char > width and index > start:
+            pieces.append((line[start:index], length))
+            start = index
+            length = 0
+
+        length += width_of_char
+
+    pieces.append((line[start:], length))
+    return pieces